@@ -9,42 +9,100 @@ import tensorflow as tf
 import mediapipe as mp
 import json
 import os
+import sys
+import time
+import queue
+import threading
 import logging
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class SignLanguageInference:
-    def __init__(self, model_path="models/sign_language_model.h5"):
+    def __init__(self, model_path="models/sign_language_model.h5", hand_landmarker_path="models/hand_landmarker.task"):
         self.model_path = model_path
+        self.hand_landmarker_path = hand_landmarker_path
         self.img_size = (64, 64)
         self.model = None
+        self._infer = None
         self.asl_alphabet = {}
         self.reverse_alphabet = {}
+        self._class_names = np.array([], dtype=object)
+        self._input_scale = 1.0  # Set from the loaded model; in-graph Rescaling models take raw 0-255 pixels
         
-        # Initialize MediaPipe
+        # Frame differencing gate: reuse the last result while the scene is static
+        self._prev_small = None
+        self._cached_predictions = []
+        self.scene_change_threshold = 3.0  # Mean absolute difference on a 32x32 grayscale thumbnail
+        
+        # Preallocated preprocessing buffers reused for every frame
+        self._resized_u8 = np.empty((self.img_size[1], self.img_size[0], 3), dtype=np.uint8)
+        self._rgb_u8 = np.empty_like(self._resized_u8)
+        self.max_num_hands = 2
+        self._input = np.empty((self.max_num_hands, self.img_size[1], self.img_size[0], 3), dtype=np.float32)
+        self._rgb_buf = np.empty(0, dtype=np.uint8)  # Grown on demand to the largest frame seen
+        
+        # Initialize MediaPipe, preferring the Tasks HandLandmarker on the GPU
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.hand_landmarker = self.create_hand_landmarker()
+        self._last_timestamp_ms = 0
+        if self.hand_landmarker is None:
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=self.max_num_hands,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
         
         # Load model and metadata
         self.load_model()
         self.load_metadata()
 
+    def create_hand_landmarker(self):
+        """
+        Create a MediaPipe Tasks HandLandmarker with the GPU delegate.
+        Returns None when the task file is missing or the GPU delegate cannot be initialized.
+        """
+        if not os.path.exists(self.hand_landmarker_path):
+            return None
+        
+        try:
+            from mediapipe.tasks.python import BaseOptions
+            from mediapipe.tasks.python.vision import HandLandmarker, HandLandmarkerOptions, RunningMode
+            
+            options = HandLandmarkerOptions(
+                base_options=BaseOptions(
+                    model_asset_path=self.hand_landmarker_path,
+                    delegate=BaseOptions.Delegate.GPU
+                ),
+                running_mode=RunningMode.VIDEO,
+                num_hands=self.max_num_hands,
+                min_hand_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+            hand_landmarker = HandLandmarker.create_from_options(options)
+            logger.info("MediaPipe HandLandmarker initialized with GPU delegate")
+            return hand_landmarker
+        except Exception as e:
+            logger.warning(f"GPU HandLandmarker unavailable, using CPU Hands solution: {str(e)}")
+            return None
+
     def load_model(self):
         """
-        Load the trained model
+        Load the trained model, preferring the int8 TFLite export when present
         """
         try:
-            if os.path.exists(self.model_path):
+            tflite_path = os.path.join(os.path.dirname(self.model_path), 'sign_language_model_int8.tflite')
+            if os.path.exists(tflite_path):
+                self._infer = self.build_tflite_function(tflite_path)
+                logger.info(f"Quantized TFLite model loaded successfully from {tflite_path}")
+            elif os.path.exists(self.model_path):
                 self.model = tf.keras.models.load_model(self.model_path)
+                self._input_scale = 1.0 if self.has_rescaling_layer(self.model) else 1 / 255.0
+                self._infer = self.build_inference_function(self.model)
                 logger.info(f"Model loaded successfully from {self.model_path}")
             else:
                 logger.error(f"Model file not found: {self.model_path}")
@@ -52,6 +110,63 @@ class SignLanguageInference:
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
             self.model = None
+            self._infer = None
+
+    def has_rescaling_layer(self, model) -> bool:
+        """
+        Check whether the model normalizes pixels itself with a leading Rescaling layer
+        """
+        layer = model
+        while getattr(layer, 'layers', None):
+            # Descend into nested models (e.g. the softmax wrapper) to the first real layer
+            layer = next(
+                (l for l in layer.layers if not isinstance(l, tf.keras.layers.InputLayer)),
+                None
+            )
+        return isinstance(layer, tf.keras.layers.Rescaling)
+
+    def build_inference_function(self, model):
+        """
+        Trace the model once into a concrete graph function for per-frame inference.
+        Calling this avoids the per-call dispatch overhead of model.predict().
+        """
+        concrete = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec((None, *self.img_size, 3), tf.float32)]
+        ).get_concrete_function()
+        return lambda x: concrete(tf.constant(x)).numpy()
+
+    def build_tflite_function(self, tflite_path: str):
+        """
+        Build an inference function around an int8 TFLite interpreter.
+        Float inputs are quantized and int8 outputs dequantized using the model's own parameters.
+        """
+        interpreter = tf.lite.Interpreter(model_path=tflite_path, num_threads=os.cpu_count())
+        interpreter.allocate_tensors()
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        in_scale, in_zero = input_details['quantization']
+        out_scale, out_zero = output_details['quantization']
+        
+        # The int8 input scale comes from the calibration data's range: ~1.0 for
+        # raw 0-255 pixels (in-graph Rescaling), ~1/255 for pre-normalized input
+        self._input_scale = 1 / 255.0 if 0 < in_scale < 0.1 else 1.0
+
+        def infer(x: np.ndarray) -> np.ndarray:
+            if interpreter.get_input_details()[0]['shape'][0] != len(x):
+                # Resize the batch dimension to the number of hands in this frame
+                interpreter.resize_tensor_input(input_details['index'], x.shape)
+                interpreter.allocate_tensors()
+            if in_scale:
+                x = np.clip(np.round(x / in_scale + in_zero), -128, 127)
+            interpreter.set_tensor(input_details['index'], x.astype(input_details['dtype']))
+            interpreter.invoke()
+            output = interpreter.get_tensor(output_details['index'])
+            if out_scale:
+                output = (output.astype(np.float32) - out_zero) * out_scale
+            return output
+
+        return infer
 
     def load_metadata(self):
         """
@@ -74,104 +189,200 @@ class SignLanguageInference:
                 }
                 self.reverse_alphabet = {v: k for k, v in self.asl_alphabet.items()}
                 logger.warning("Using default alphabet mapping")
+            
+            # Index-aligned class names so decoding is a plain array lookup
+            num_classes = max(self.reverse_alphabet, default=-1) + 1
+            self._class_names = np.array(
+                [self.reverse_alphabet.get(i, 'UNKNOWN') for i in range(num_classes)],
+                dtype=object
+            )
         except Exception as e:
             logger.error(f"Error loading metadata: {str(e)}")
 
-    def preprocess_image(self, image: np.ndarray) -> np.ndarray:
+    def preprocess_images(self, images: List[np.ndarray]) -> Optional[np.ndarray]:
         """
-        Preprocess image for model input
+        Preprocess BGR crops into one model input batch.
+        Resize, RGB conversion and normalization all write into preallocated buffers;
+        the returned array is a view that is reused on the next call.
         """
         try:
-            # Resize to model input size
-            resized = cv2.resize(image, self.img_size)
-            
-            # Normalize pixel values
-            normalized = resized.astype(np.float32) / 255.0
+            for i, image in enumerate(images[:self.max_num_hands]):
+                # Resize to model input size
+                cv2.resize(image, self.img_size, dst=self._resized_u8, interpolation=cv2.INTER_AREA)
+                
+                # Match the RGB channel order used during training
+                cv2.cvtColor(self._resized_u8, cv2.COLOR_BGR2RGB, dst=self._rgb_u8)
+                
+                # Scale pixel values straight into the batched input buffer
+                np.multiply(self._rgb_u8, self._input_scale, out=self._input[i], dtype=np.float32)
             
-            # Add batch dimension
-            return np.expand_dims(normalized, axis=0)
+            return self._input[:min(len(images), self.max_num_hands)]
         except Exception as e:
             logger.error(f"Error preprocessing image: {str(e)}")
             return None
 
-    def extract_hand_region(self, image: np.ndarray) -> Optional[np.ndarray]:
+    def preprocess_image(self, image: np.ndarray) -> Optional[np.ndarray]:
         """
-        Extract hand region from image using MediaPipe
+        Preprocess a single BGR crop for model input
+        """
+        return self.preprocess_images([image])
+
+    def to_rgb(self, image: np.ndarray) -> np.ndarray:
+        """
+        Convert a BGR image to RGB inside a reused buffer.
+        The result is a contiguous view that is overwritten on the next call.
+        """
+        if self._rgb_buf.size < image.size:
+            self._rgb_buf = np.empty(image.size, dtype=np.uint8)
+        rgb_image = self._rgb_buf[:image.size].reshape(image.shape)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=rgb_image)
+        return rgb_image
+
+    def detect_hands(self, rgb_image: np.ndarray) -> list:
+        """
+        Run hand detection and return per-hand landmark lists.
+        Both detectors run in tracking mode, so palm detection only reruns when
+        landmark tracking confidence drops below min_tracking_confidence.
+        """
+        if self.hand_landmarker is not None:
+            # VIDEO mode requires strictly increasing timestamps
+            timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+            self._last_timestamp_ms = timestamp_ms
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
+            result = self.hand_landmarker.detect_for_video(mp_image, timestamp_ms)
+            return result.hand_landmarks
+        
+        results = self.hands.process(rgb_image)
+        if not results.multi_hand_landmarks:
+            return []
+        return [hand.landmark for hand in results.multi_hand_landmarks]
+
+    def extract_hand_regions(self, image: np.ndarray) -> List[np.ndarray]:
+        """
+        Extract every detected hand region from image using MediaPipe
         """
         try:
-            # Convert BGR to RGB
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            h, w, _ = image.shape
             
-            # Process the image
-            results = self.hands.process(rgb_image)
+            # Always pass the full frame so MediaPipe's own tracking state stays in
+            # frame coordinates; it skips palm detection while tracking holds
+            hands = self.detect_hands(self.to_rgb(image))
             
-            if results.multi_hand_landmarks:
-                # Get the first hand
-                hand_landmarks = results.multi_hand_landmarks[0]
-                
-                # Get bounding box
-                h, w, _ = image.shape
-                x_coords = [landmark.x * w for landmark in hand_landmarks.landmark]
-                y_coords = [landmark.y * h for landmark in hand_landmarks.landmark]
-                
-                x_min, x_max = int(min(x_coords)), int(max(x_coords))
-                y_min, y_max = int(min(y_coords)), int(max(y_coords))
+            if not hands:
+                return []
+            
+            hand_regions = []
+            for hand_landmarks in hands:
+                # Get bounding box in full-frame coordinates
+                points = np.fromiter(
+                    (v for landmark in hand_landmarks for v in (landmark.x, landmark.y)),
+                    dtype=np.float32,
+                    count=2 * len(hand_landmarks)
+                ).reshape(-1, 2)
+                points *= (w, h)
+                (x_min, y_min), (x_max, y_max) = points.min(axis=0).astype(int), points.max(axis=0).astype(int)
                 
-                # Add padding
+                # Add padding and clip to the frame
                 padding = 20
-                x_min = max(0, x_min - padding)
-                y_min = max(0, y_min - padding)
-                x_max = min(w, x_max + padding)
-                y_max = min(h, y_max + padding)
+                x_min, x_max = np.clip((x_min - padding, x_max + padding), 0, w)
+                y_min, y_max = np.clip((y_min - padding, y_max + padding), 0, h)
                 
                 # Extract hand region
-                hand_region = image[y_min:y_max, x_min:x_max]
-                
-                return hand_region
+                hand_regions.append(image[y_min:y_max, x_min:x_max])
             
-            return None
+            return hand_regions
         except Exception as e:
             logger.error(f"Error extracting hand region: {str(e)}")
-            return None
+            return []
 
-    def predict_sign(self, image: np.ndarray) -> Tuple[Optional[str], float]:
+    def extract_hand_region(self, image: np.ndarray) -> Optional[np.ndarray]:
         """
-        Predict sign language from image
+        Extract the first detected hand region from image
+        """
+        hand_regions = self.extract_hand_regions(image)
+        return hand_regions[0] if hand_regions else None
+
+    def classify(self, processed_images: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Classify a preprocessed batch of hand crops
+        """
+        predictions = self._infer(processed_images)
+        predicted_classes = predictions.argmax(axis=1)
+        confidences = predictions[np.arange(len(predictions)), predicted_classes]
+        
+        # Get class names
+        num_names = len(self._class_names)
+        return [
+            (self._class_names[idx] if idx < num_names else 'UNKNOWN', float(confidence))
+            for idx, confidence in zip(predicted_classes.tolist(), confidences.tolist())
+        ]
+
+    def scene_unchanged(self, image: np.ndarray) -> bool:
+        """
+        Check whether image is nearly identical to the last frame that was fully processed
+        """
+        try:
+            small = cv2.cvtColor(cv2.resize(image, (32, 32), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+            if self._prev_small is not None:
+                diff = cv2.norm(small, self._prev_small, cv2.NORM_L1) / small.size
+                if diff < self.scene_change_threshold:
+                    return True
+            self._prev_small = small
+            return False
+        except Exception as e:
+            logger.error(f"Error comparing frames: {str(e)}")
+            self._prev_small = None
+            return False
+
+    def predict_signs(self, image: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Predict sign language for every detected hand, reusing the previous
+        result when the scene has not changed
+        """
+        if self.scene_unchanged(image):
+            return self._cached_predictions
+        
+        self._cached_predictions = self.run_prediction(image)
+        return self._cached_predictions
+
+    def run_prediction(self, image: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Run detection and classify every detected hand with a single batched model call
         """
         try:
-            if self.model is None:
-                return None, 0.0
+            if self._infer is None:
+                return []
             
-            # Extract hand region
-            hand_region = self.extract_hand_region(image)
+            # Extract hand regions
+            hand_regions = self.extract_hand_regions(image)
             
-            if hand_region is None:
-                return None, 0.0
+            if not hand_regions:
+                return []
             
-            # Preprocess image
-            processed_image = self.preprocess_image(hand_region)
+            # Preprocess all hands into one batch
+            processed_images = self.preprocess_images(hand_regions)
             
-            if processed_image is None:
-                return None, 0.0
+            if processed_images is None:
+                return []
             
             # Make prediction
-            predictions = self.model.predict(processed_image, verbose=0)
-            predicted_class = np.argmax(predictions[0])
-            confidence = float(np.max(predictions[0]))
-            
-            # Get class name
-            class_name = self.reverse_alphabet.get(predicted_class, 'UNKNOWN')
-            
-            return class_name, confidence
+            return self.classify(processed_images)
         except Exception as e:
             logger.error(f"Error predicting sign: {str(e)}")
-            return None, 0.0
+            return []
+
+    def predict_sign(self, image: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        Predict sign language from image
+        """
+        predictions = self.predict_signs(image)
+        return predictions[0] if predictions else (None, 0.0)
 
     def is_ready(self) -> bool:
         """
         Check if the model is ready for inference
         """
-        return self.model is not None
+        return self._infer is not None
 
     def get_supported_classes(self) -> list:
         """
@@ -183,10 +394,141 @@ class SignLanguageInference:
         """
         Cleanup resources
         """
+        if getattr(self, 'hand_landmarker', None) is not None:
+            self.hand_landmarker.close()
         if hasattr(self, 'hands'):
             self.hands.close()
         logger.info("Sign Language Inference cleaned up")
 
+def open_webcam(index: int = 0, width: int = 640, height: int = 480) -> cv2.VideoCapture:
+    """
+    Open the webcam with MJPG at a reduced resolution and a one-frame buffer
+    """
+    if sys.platform.startswith('win'):
+        cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+    elif sys.platform.startswith('linux'):
+        cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+    else:
+        cap = cv2.VideoCapture(index)
+    
+    if not cap.isOpened():
+        # Fall back to the default backend
+        cap = cv2.VideoCapture(index)
+    
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+def put_latest(q: queue.Queue, item):
+    """
+    Put item on a bounded queue, discarding the oldest entry when it is full
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+class WebcamPipeline:
+    """
+    Runs capture, hand detection and model inference on separate threads
+    connected by small bounded queues, so throughput is set by the slowest
+    stage instead of the sum of all stages.
+    """
+    
+    def __init__(self, inference: SignLanguageInference, cap: cv2.VideoCapture):
+        self.inference = inference
+        self.cap = cap
+        self.stop_event = threading.Event()
+        self.frame_queue = queue.Queue(maxsize=2)
+        self.batch_queue = queue.Queue(maxsize=2)
+        self.lock = threading.Lock()
+        self.latest_frame = None
+        self.latest_prediction = (None, 0.0)
+        self.threads = [
+            threading.Thread(target=self.capture_loop, daemon=True),
+            threading.Thread(target=self.detection_loop, daemon=True),
+            threading.Thread(target=self.inference_loop, daemon=True)
+        ]
+
+    def capture_loop(self):
+        """
+        Read and mirror webcam frames
+        """
+        while not self.stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                self.stop_event.set()
+                break
+            
+            # Flip frame horizontally for mirror effect
+            frame = cv2.flip(frame, 1)
+            
+            with self.lock:
+                self.latest_frame = frame
+            put_latest(self.frame_queue, frame)
+
+    def detection_loop(self):
+        """
+        Find hands and preprocess them into a model input batch
+        """
+        while not self.stop_event.is_set():
+            try:
+                frame = self.frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            # Keep the current prediction while the scene is static
+            if self.inference.scene_unchanged(frame):
+                continue
+            
+            hand_regions = self.inference.extract_hand_regions(frame)
+            batch = self.inference.preprocess_images(hand_regions) if hand_regions else None
+            
+            # Copy out of the shared preprocessing buffer before handing off
+            put_latest(self.batch_queue, None if batch is None else batch.copy())
+
+    def inference_loop(self):
+        """
+        Run the model; all inference calls stay on this thread
+        """
+        while not self.stop_event.is_set():
+            try:
+                batch = self.batch_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            try:
+                predictions = self.inference.classify(batch) if batch is not None else []
+            except Exception as e:
+                logger.error(f"Error predicting sign: {str(e)}")
+                predictions = []
+            
+            with self.lock:
+                self.latest_prediction = predictions[0] if predictions else (None, 0.0)
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout=1.0)
+
+    def latest(self):
+        """
+        Get the freshest frame together with the most recent classification
+        """
+        with self.lock:
+            return self.latest_frame, self.latest_prediction
+
 def main():
     """
     Main function for testing the inference
@@ -199,7 +541,7 @@ def main():
         return
     
     # Test with webcam
-    cap = cv2.VideoCapture(0)
+    cap = open_webcam(0)
     
     if not cap.isOpened():
         logger.error("Could not open webcam!")
@@ -208,16 +550,17 @@ def main():
     logger.info("Starting real-time sign language recognition...")
     logger.info("Press 'q' to quit")
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
+    pipeline = WebcamPipeline(inference, cap)
+    pipeline.start()
+    
+    while not pipeline.stop_event.is_set():
+        frame, (sign, confidence) = pipeline.latest()
+        if frame is None:
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+            continue
         
-        # Predict sign
-        sign, confidence = inference.predict_sign(frame)
+        frame = frame.copy()
         
         # Draw results on frame
         if sign and confidence > 0.7:
@@ -237,6 +580,7 @@ def main():
             break
     
     # Cleanup
+    pipeline.stop()
     cap.release()
     cv2.destroyAllWindows()
     inference.cleanup()
@@ -4,9 +4,12 @@ This script downloads and sets up the Vosk model for offline speech recognition.
 """
 
 import os
+import shutil
+import tempfile
 import urllib.request
 import zipfile
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Set up logging
@@ -18,6 +21,12 @@ class VoskSetup:
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(exist_ok=True)
         
+        # Parallel download / extraction settings
+        self.download_workers = 8
+        self.part_size = 16 * 1024 * 1024
+        self.extract_workers = os.cpu_count() or 1
+        self.copy_chunk_size = 8 * 1024 * 1024
+        
         # Vosk model URLs and info
         self.models = {
             "small": {
@@ -37,21 +46,70 @@ class VoskSetup:
             }
         }
 
-    def download_file(self, url: str, filename: str) -> bool:
+    def get_range_size(self, url: str) -> int:
+        """
+        Get the remote file size if the server supports byte-range requests, otherwise 0
+        """
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request) as response:
+            if response.headers.get("Accept-Ranges") != "bytes":
+                return 0
+            return int(response.headers.get("Content-Length", 0))
+
+    def download_range(self, url: str, filepath: Path, start: int, end: int) -> int:
+        """
+        Download bytes start..end (inclusive) of url into the same offset of filepath
         """
-        Download a file from URL
+        request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+        with urllib.request.urlopen(request) as response, open(filepath, "r+b") as f:
+            f.seek(start)
+            shutil.copyfileobj(response, f, self.copy_chunk_size)
+        return end - start + 1
+
+    def download_file(self, url: str, filepath: Path) -> bool:
         """
+        Download a file from URL to filepath using parallel range requests when the server allows it
+        """
+        filename = filepath.name
         try:
-            filepath = self.models_dir / filename
             logger.info(f"Downloading {filename}...")
             
-            def progress_hook(block_num, block_size, total_size):
-                downloaded = block_num * block_size
-                if total_size > 0:
-                    percent = (downloaded / total_size) * 100
-                    print(f"\rProgress: {percent:.1f}%", end="", flush=True)
+            total_size = self.get_range_size(url)
             
-            urllib.request.urlretrieve(url, filepath, progress_hook)
+            if total_size > self.part_size:
+                # Preallocate the file and fetch fixed-size parts concurrently
+                with open(filepath, "wb") as f:
+                    f.truncate(total_size)
+                
+                ranges = [
+                    (start, min(start + self.part_size, total_size) - 1)
+                    for start in range(0, total_size, self.part_size)
+                ]
+                
+                downloaded = 0
+                with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                    futures = [
+                        executor.submit(self.download_range, url, filepath, start, end)
+                        for start, end in ranges
+                    ]
+                    for future in as_completed(futures):
+                        downloaded += future.result()
+                        percent = (downloaded / total_size) * 100
+                        print(f"\rProgress: {percent:.1f}%", end="", flush=True)
+            else:
+                # Single stream copied in large chunks
+                with urllib.request.urlopen(url) as response, open(filepath, "wb") as f:
+                    total_size = int(response.headers.get("Content-Length", 0))
+                    downloaded = 0
+                    while True:
+                        chunk = response.read(self.copy_chunk_size)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if total_size > 0:
+                            percent = (downloaded / total_size) * 100
+                            print(f"\rProgress: {percent:.1f}%", end="", flush=True)
             print()  # New line after progress
             
             logger.info(f"Downloaded {filename} successfully")
@@ -59,11 +117,14 @@ class VoskSetup:
             
         except Exception as e:
             logger.error(f"Error downloading {filename}: {str(e)}")
+            # Don't leave a partial file that would be mistaken for a finished download
+            if filepath.exists():
+                filepath.unlink()
             return False
 
     def extract_zip(self, zip_path: Path, extract_dir: str) -> bool:
         """
-        Extract ZIP file
+        Extract ZIP file using several worker threads, each with its own ZipFile handle
         """
         try:
             extract_path = self.models_dir / extract_dir
@@ -71,7 +132,24 @@ class VoskSetup:
             logger.info(f"Extracting {zip_path.name}...")
             
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.models_dir)
+                names = [info.filename for info in zip_ref.infolist() if not info.is_dir()]
+            
+            # Create directories up front so workers never race on makedirs
+            root = self.models_dir.resolve()
+            for parent in {os.path.dirname(name) for name in names}:
+                target = (root / parent).resolve()
+                if root not in (target, *target.parents):
+                    raise ValueError(f"Unsafe path in archive: {parent}")
+                target.mkdir(parents=True, exist_ok=True)
+            
+            def extract_members(batch):
+                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                    for name in batch:
+                        zip_ref.extract(name, self.models_dir)
+            
+            workers = max(1, min(self.extract_workers, len(names)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(extract_members, [names[i::workers] for i in range(workers)]))
             
             logger.info(f"Extracted to {extract_path}")
             return True
@@ -97,12 +175,16 @@ class VoskSetup:
             logger.info(f"Model {model_size} already exists at {extract_path}")
             return True
         
-        # Download if not exists
+        # Download into a temporary directory that is removed as soon as extraction
+        # finishes or fails, so the archive never outlives the extracted model
         if not zip_path.exists():
-            if not self.download_file(model_info["url"], model_info["filename"]):
-                return False
+            with tempfile.TemporaryDirectory(dir=self.models_dir) as temp_dir:
+                temp_zip_path = Path(temp_dir) / model_info["filename"]
+                if not self.download_file(model_info["url"], temp_zip_path):
+                    return False
+                return self.extract_zip(temp_zip_path, model_info["extract_dir"])
         
-        # Extract
+        # Extract a manually provided archive
         if not self.extract_zip(zip_path, model_info["extract_dir"]):
             return False
         
@@ -8,16 +8,15 @@ import cv2
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, confusion_matrix
 import tensorflow as tf
 from tensorflow.keras import layers, models, optimizers, callbacks
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
 import mediapipe as mp
 from tqdm import tqdm
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +30,12 @@ class SignLanguageTrainer:
         self.num_classes = 29  # 26 letters + space + delete + nothing
         self.batch_size = 32
         self.epochs = 50
+        self.plot_show = False  # Display plots interactively in addition to saving them
+        
+        # Train in mixed precision when a GPU is available (float16 compute, float32 variables)
+        if tf.config.list_physical_devices('GPU'):
+            tf.keras.mixed_precision.set_global_policy('mixed_float16')
+            logger.info("Mixed precision training enabled")
         
         # Create directories
         os.makedirs(self.model_dir, exist_ok=True)
@@ -53,63 +58,73 @@ class SignLanguageTrainer:
             min_detection_confidence=0.7
         )
 
-    def create_synthetic_dataset(self):
+    def create_synthetic_dataset(self, images_per_class=100):
         """
         Create a synthetic dataset for demonstration purposes
         In a real implementation, you would use actual ASL dataset
         """
         logger.info("Creating synthetic dataset...")
         
-        # Create synthetic images for each class
-        for class_name, class_id in self.asl_alphabet.items():
+        # Generate every class in memory, then encode and write the JPEGs in parallel
+        writes = []
+        for class_name in self.asl_alphabet:
             class_dir = os.path.join(self.data_dir, class_name)
             os.makedirs(class_dir, exist_ok=True)
             
-            # Generate synthetic images
-            for i in range(100):  # 100 images per class
-                img = self.generate_synthetic_image(class_name)
-                img_path = os.path.join(class_dir, f"{class_name}_{i:03d}.jpg")
-                cv2.imwrite(img_path, img)
+            images = self.generate_synthetic_images(class_name, images_per_class)
+            for i, img in enumerate(images):
+                writes.append((os.path.join(class_dir, f"{class_name}_{i:03d}.jpg"), img))
+        
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(lambda args: cv2.imwrite(*args), writes))
         
         logger.info(f"Synthetic dataset created with {len(self.asl_alphabet)} classes")
 
-    def generate_synthetic_image(self, class_name):
+    def generate_synthetic_images(self, class_name, count):
         """
-        Generate synthetic images for demonstration
+        Generate a batch of synthetic images for demonstration
         In a real implementation, you would use actual ASL images
         """
-        # Create a random image with some pattern based on class
-        img = np.random.randint(0, 255, (self.img_size[0], self.img_size[1], 3), dtype=np.uint8)
+        rng = np.random.default_rng()
+        height, width = self.img_size
+        shape = (count, height, width, 3)
+        
+        # Create random images with some pattern based on class
+        images = rng.integers(0, 255, shape, dtype=np.uint8)
+        yy, xx = np.ogrid[:height, :width]
         
         # Add some class-specific patterns
         if class_name == 'A':
             # Draw a simple 'A' pattern
-            cv2.circle(img, (32, 32), 15, (255, 255, 255), -1)
+            images[:, (yy - 32) ** 2 + (xx - 32) ** 2 <= 15 ** 2] = 255
         elif class_name == 'B':
             # Draw a simple 'B' pattern
-            cv2.rectangle(img, (20, 20), (44, 44), (255, 255, 255), -1)
+            images[:, 20:45, 20:45] = 255
         elif class_name == 'SPACE':
             # Empty image for space
-            img = np.zeros((self.img_size[0], self.img_size[1], 3), dtype=np.uint8)
+            images[:] = 0
         elif class_name == 'NOTHING':
             # Random noise for nothing
-            img = np.random.randint(0, 50, (self.img_size[0], self.img_size[1], 3), dtype=np.uint8)
+            images = rng.integers(0, 50, shape, dtype=np.uint8)
         else:
-            # Add some random shapes for other classes
-            center = (np.random.randint(20, 44), np.random.randint(20, 44))
-            radius = np.random.randint(5, 15)
-            color = (np.random.randint(100, 255), np.random.randint(100, 255), np.random.randint(100, 255))
-            cv2.circle(img, center, radius, color, -1)
-        
-        return img
+            # Add a random circle per image for other classes
+            cy = rng.integers(20, 44, count)[:, None, None]
+            cx = rng.integers(20, 44, count)[:, None, None]
+            radius = rng.integers(5, 15, count)[:, None, None]
+            colors = rng.integers(100, 255, (count, 1, 1, 3), dtype=np.uint8)
+            mask = (yy - cy) ** 2 + (xx - cx) ** 2 <= radius ** 2
+            images = np.where(mask[..., None], colors, images)
+        
+        return images
 
     def load_dataset(self):
         """
-        Load and preprocess the dataset
+        Collect image paths and labels for the dataset.
+        Decoding happens later in the tf.data pipeline built by make_dataset().
         """
         logger.info("Loading dataset...")
         
-        images = []
+        image_paths = []
         labels = []
         
         for class_name, class_id in self.asl_alphabet.items():
@@ -121,49 +136,72 @@ class SignLanguageTrainer:
             
             for img_file in os.listdir(class_dir):
                 if img_file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    img_path = os.path.join(class_dir, img_file)
-                    
-                    # Load and preprocess image
-                    img = cv2.imread(img_path)
-                    if img is not None:
-                        img = cv2.resize(img, self.img_size)
-                        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                        img = img.astype(np.float32) / 255.0
-                        
-                        images.append(img)
-                        labels.append(class_id)
-        
-        images = np.array(images)
+                    image_paths.append(os.path.join(class_dir, img_file))
+                    labels.append(class_id)
+        
+        image_paths = np.array(image_paths)
         labels = np.array(labels)
         
-        logger.info(f"Dataset loaded: {len(images)} images, {len(set(labels))} classes")
-        return images, labels
+        logger.info(f"Dataset loaded: {len(image_paths)} images, {len(set(labels))} classes")
+        return image_paths, labels
+
+    def decode_image(self, path, label):
+        """
+        Read, decode and resize a single image, keeping uint8 pixels.
+        Normalization happens inside the model's Rescaling layer.
+        """
+        img = tf.io.decode_image(tf.io.read_file(path), channels=3, expand_animations=False)
+        img = tf.image.resize(img, self.img_size)
+        return tf.cast(tf.clip_by_value(tf.round(img), 0, 255), tf.uint8), label
+
+    def make_dataset(self, image_paths, labels, training=False):
+        """
+        Build a batched, prefetched tf.data pipeline that decodes images in parallel
+        """
+        dataset = tf.data.Dataset.from_tensor_slices((image_paths, labels))
+        
+        if training:
+            dataset = dataset.shuffle(len(image_paths), reshuffle_each_iteration=True)
+        
+        dataset = dataset.map(self.decode_image, num_parallel_calls=tf.data.AUTOTUNE)
+        dataset = dataset.batch(self.batch_size)
+        
+        return dataset.prefetch(tf.data.AUTOTUNE)
 
     def create_model(self):
         """
         Create the CNN model architecture
         """
         model = models.Sequential([
+            # Normalize uint8 pixels in-graph
+            layers.Rescaling(1.0 / 255, input_shape=(*self.img_size, 3)),
+            
+            # Data augmentation (active only during training)
+            layers.RandomRotation(20 / 360, fill_mode='nearest'),
+            layers.RandomTranslation(0.2, 0.2, fill_mode='nearest'),
+            layers.RandomFlip('horizontal'),
+            layers.RandomZoom(0.2, fill_mode='nearest'),
+            
             # First convolutional block
-            layers.Conv2D(32, (3, 3), activation='relu', input_shape=(*self.img_size, 3)),
+            layers.SeparableConv2D(32, (3, 3), activation='relu'),
             layers.BatchNormalization(),
             layers.MaxPooling2D((2, 2)),
             layers.Dropout(0.25),
             
             # Second convolutional block
-            layers.Conv2D(64, (3, 3), activation='relu'),
+            layers.SeparableConv2D(64, (3, 3), activation='relu'),
             layers.BatchNormalization(),
             layers.MaxPooling2D((2, 2)),
             layers.Dropout(0.25),
             
             # Third convolutional block
-            layers.Conv2D(128, (3, 3), activation='relu'),
+            layers.SeparableConv2D(128, (3, 3), activation='relu'),
             layers.BatchNormalization(),
             layers.MaxPooling2D((2, 2)),
             layers.Dropout(0.25),
             
             # Fourth convolutional block
-            layers.Conv2D(256, (3, 3), activation='relu'),
+            layers.SeparableConv2D(256, (3, 3), activation='relu'),
             layers.BatchNormalization(),
             layers.MaxPooling2D((2, 2)),
             layers.Dropout(0.25),
@@ -175,39 +213,38 @@ class SignLanguageTrainer:
             layers.Dropout(0.5),
             layers.Dense(256, activation='relu'),
             layers.Dropout(0.5),
-            layers.Dense(self.num_classes, activation='softmax')
+            layers.Dense(self.num_classes, dtype='float32')  # Logits; see create_inference_model()
         ])
         
         return model
 
+    def create_inference_model(self, model):
+        """
+        Append a softmax to the trained logits model so saved models output probabilities
+        """
+        return models.Sequential([
+            model,
+            layers.Softmax(dtype='float32')
+        ])
+
     def compile_model(self, model):
         """
         Compile the model with optimizer and loss function
         """
         model.compile(
             optimizer=optimizers.Adam(learning_rate=0.001),
-            loss='sparse_categorical_crossentropy',
+            loss=tf.keras.losses.SparseCategoricalCrossentropy(from_logits=True),
             metrics=['accuracy']
         )
         
         return model
 
-    def train_model(self, model, X_train, y_train, X_val, y_val):
+    def train_model(self, model, train_dataset, val_dataset):
         """
         Train the model
         """
         logger.info("Starting model training...")
         
-        # Data augmentation
-        train_datagen = ImageDataGenerator(
-            rotation_range=20,
-            width_shift_range=0.2,
-            height_shift_range=0.2,
-            horizontal_flip=True,
-            zoom_range=0.2,
-            fill_mode='nearest'
-        )
-        
         # Callbacks
         callbacks_list = [
             callbacks.EarlyStopping(
@@ -221,34 +258,48 @@ class SignLanguageTrainer:
                 patience=5,
                 min_lr=0.0001
             ),
+            # Weights only: the trained model outputs logits, so save_best_model() rebuilds
+            # the checkpoint with the softmax appended, like sign_language_model.h5
             callbacks.ModelCheckpoint(
-                filepath=os.path.join(self.model_dir, 'best_model.h5'),
+                filepath=os.path.join(self.model_dir, 'best_model.weights.h5'),
                 monitor='val_accuracy',
                 save_best_only=True,
-                save_weights_only=False
+                save_weights_only=True
             )
         ]
         
         # Train the model
         history = model.fit(
-            train_datagen.flow(X_train, y_train, batch_size=self.batch_size),
-            steps_per_epoch=len(X_train) // self.batch_size,
+            train_dataset,
             epochs=self.epochs,
-            validation_data=(X_val, y_val),
+            validation_data=val_dataset,
             callbacks=callbacks_list,
             verbose=1
         )
         
         return history
 
-    def evaluate_model(self, model, X_test, y_test):
+    def save_best_model(self):
+        """
+        Save the best checkpointed weights as best_model.h5, outputting probabilities
+        """
+        weights_path = os.path.join(self.model_dir, 'best_model.weights.h5')
+        if not os.path.exists(weights_path):
+            return
+        
+        best_model = self.create_model()
+        best_model.load_weights(weights_path)
+        self.create_inference_model(best_model).save(os.path.join(self.model_dir, 'best_model.h5'))
+        logger.info("Best checkpoint saved to best_model.h5")
+
+    def evaluate_model(self, model, test_dataset, y_test):
         """
         Evaluate the model performance
         """
         logger.info("Evaluating model...")
         
         # Get predictions
-        y_pred = model.predict(X_test)
+        y_pred = model.predict(test_dataset)
         y_pred_classes = np.argmax(y_pred, axis=1)
         
         # Calculate accuracy
@@ -263,19 +314,57 @@ class SignLanguageTrainer:
         cm = confusion_matrix(y_test, y_pred_classes)
         
         # Plot confusion matrix
-        plt.figure(figsize=(12, 10))
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues',
-                   xticklabels=list(self.asl_alphabet.keys()),
-                   yticklabels=list(self.asl_alphabet.keys()))
-        plt.title('Confusion Matrix')
-        plt.xlabel('Predicted')
-        plt.ylabel('Actual')
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.model_dir, 'confusion_matrix.png'))
-        plt.show()
+        class_names = list(self.asl_alphabet.keys())
+        fig, ax = plt.subplots(figsize=(12, 10))
+        image = ax.imshow(cm, cmap='Blues')
+        fig.colorbar(image, ax=ax)
+        ax.set_xticks(range(len(class_names)))
+        ax.set_xticklabels(class_names)
+        ax.set_yticks(range(len(class_names)))
+        ax.set_yticklabels(class_names)
+        
+        # Annotate non-zero cells only
+        threshold = cm.max() / 2 if cm.size else 0
+        for i, j in zip(*np.nonzero(cm)):
+            ax.text(j, i, cm[i, j], ha='center', va='center', fontsize=7,
+                    color='white' if cm[i, j] > threshold else 'black')
+        
+        ax.set_title('Confusion Matrix')
+        ax.set_xlabel('Predicted')
+        ax.set_ylabel('Actual')
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.model_dir, 'confusion_matrix.png'))
+        if self.plot_show:
+            plt.show()
+        plt.close(fig)
         
         return accuracy, report, cm
 
+    def quantize_model(self, model, dataset):
+        """
+        Export an int8 TFLite model using post-training quantization.
+        A slice of the given dataset is used as the representative dataset for calibration.
+        """
+        logger.info("Quantizing model to int8 TFLite...")
+        
+        def representative_dataset():
+            for image, _ in dataset.unbatch().take(200):
+                yield [tf.cast(image[tf.newaxis], tf.float32)]
+        
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+        
+        tflite_path = os.path.join(self.model_dir, 'sign_language_model_int8.tflite')
+        with open(tflite_path, 'wb') as f:
+            f.write(converter.convert())
+        
+        logger.info(f"Quantized model saved to {tflite_path}")
+        return tflite_path
+
     def plot_training_history(self, history):
         """
         Plot training history
@@ -302,7 +391,9 @@ class SignLanguageTrainer:
         
         plt.tight_layout()
         plt.savefig(os.path.join(self.model_dir, 'training_history.png'))
-        plt.show()
+        if self.plot_show:
+            plt.show()
+        plt.close(fig)
 
     def save_model_info(self, model, accuracy, report):
         """
@@ -312,13 +403,14 @@ class SignLanguageTrainer:
             'model_name': 'sign_language_recognition',
             'version': '1.0.0',
             'input_shape': (*self.img_size, 3),
+            'input_range': [0, 255],
             'num_classes': self.num_classes,
             'classes': self.asl_alphabet,
             'test_accuracy': float(accuracy),
             'training_date': pd.Timestamp.now().isoformat(),
-            'model_architecture': 'CNN with 4 convolutional blocks',
+            'model_architecture': 'CNN with 4 depthwise-separable convolutional blocks',
             'optimizer': 'Adam',
-            'loss_function': 'sparse_categorical_crossentropy'
+            'loss_function': 'sparse_categorical_crossentropy (from logits)'
         }
         
         # Save model info
@@ -342,15 +434,15 @@ class SignLanguageTrainer:
             self.create_synthetic_dataset()
         
         # Load dataset
-        images, labels = self.load_dataset()
+        image_paths, labels = self.load_dataset()
         
-        if len(images) == 0:
+        if len(image_paths) == 0:
             logger.error("No images found in dataset!")
             return
         
         # Split dataset
         X_train, X_temp, y_train, y_temp = train_test_split(
-            images, labels, test_size=0.3, random_state=42, stratify=labels
+            image_paths, labels, test_size=0.3, random_state=42, stratify=labels
         )
         X_val, X_test, y_val, y_test = train_test_split(
             X_temp, y_temp, test_size=0.5, random_state=42, stratify=y_temp
@@ -358,6 +450,11 @@ class SignLanguageTrainer:
         
         logger.info(f"Dataset split - Train: {len(X_train)}, Val: {len(X_val)}, Test: {len(X_test)}")
         
+        # Build input pipelines
+        train_dataset = self.make_dataset(X_train, y_train, training=True)
+        val_dataset = self.make_dataset(X_val, y_val)
+        test_dataset = self.make_dataset(X_test, y_test)
+        
         # Create and compile model
         model = self.create_model()
         model = self.compile_model(model)
@@ -366,20 +463,33 @@ class SignLanguageTrainer:
         model.summary()
         
         # Train model
-        history = self.train_model(model, X_train, y_train, X_val, y_val)
+        history = self.train_model(model, train_dataset, val_dataset)
         
         # Evaluate model
-        accuracy, report, cm = self.evaluate_model(model, X_test, y_test)
+        accuracy, report, cm = self.evaluate_model(model, test_dataset, y_test)
         
         # Plot training history
         self.plot_training_history(history)
         
         # Save model
-        model.save(os.path.join(self.model_dir, 'sign_language_model.h5'))
+        inference_model = self.create_inference_model(model)
+        inference_model.save(os.path.join(self.model_dir, 'sign_language_model.h5'))
+        self.save_best_model()
         
-        # Save model information
+        # Save model information before the optional TFLite export, so the .h5 is
+        # usable even when quantization fails
         self.save_model_info(model, accuracy, report)
         
+        # Export int8 TFLite model for CPU inference
+        tflite_path = os.path.join(self.model_dir, 'sign_language_model_int8.tflite')
+        try:
+            self.quantize_model(inference_model, self.make_dataset(X_train, y_train))
+        except Exception as e:
+            logger.warning(f"Int8 TFLite export failed, inference will use the .h5 model: {str(e)}")
+            # Inference prefers the TFLite file, so don't leave one from an older run behind
+            if os.path.exists(tflite_path):
+                os.remove(tflite_path)
+        
         logger.info("Training completed successfully!")
         
         return model, history
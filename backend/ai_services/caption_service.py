@@ -1,13 +1,53 @@
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
+from collections import Counter, defaultdict, deque
+from itertools import count, islice
 import uuid
+import numpy as np
+
+# Random per-process bits; caption ids combine them with a counter in the low 32 bits
+PROCESS_ID = uuid.uuid4().int & ~0xFFFFFFFF
+
+# Simulated English translations keyed by (text, target_language)
+TRANSLATIONS = {
+    ("Hello everyone", "ta"): "வணக்கம் அனைவருக்கும்",
+    ("Thank you", "ta"): "நன்றி",
+    ("Yes", "ta"): "ஆம்",
+    ("No", "ta"): "இல்லை",
+    ("Please", "ta"): "தயவு செய்து",
+    ("Sorry", "ta"): "மன்னிக்கவும்",
+    ("Hello everyone", "ml"): "ഹലോ എല്ലാവർക്കും",
+    ("Thank you", "ml"): "നന്ദി",
+    ("Yes", "ml"): "അതെ",
+    ("No", "ml"): "ഇല്ല",
+    ("Please", "ml"): "ദയവായി",
+    ("Sorry", "ml"): "ക്ഷമിക്കണം",
+    ("Hello everyone", "te"): "హలో అందరికీ",
+    ("Thank you", "te"): "ధన్యవాదాలు",
+    ("Yes", "te"): "అవును",
+    ("No", "te"): "కాదు",
+    ("Please", "te"): "దయచేసి",
+    ("Sorry", "te"): "క్షమించండి"
+}
+
+def tail(entries, limit: int) -> list:
+    """
+    Return the last `limit` entries (all entries when limit is falsy) in order
+    """
+    if not limit:
+        return list(entries)
+    return list(islice(reversed(entries), limit))[::-1]
 
 class CaptionService:
     def __init__(self):
-        self.caption_history = []
         self.max_history = 100
-        self.is_ready = True
+        self.caption_history = deque(maxlen=self.max_history)
+        self._ready = True
+        self._next_id = count()
+        
+        # Secondary indexes over caption_history, kept in insertion order
+        self.reset_indexes()
         
         logging.info("Caption Service initialized")
 
@@ -25,7 +65,7 @@ class CaptionService:
         """
         try:
             caption = {
-                "id": str(uuid.uuid4()),
+                "id": self.next_caption_id(),
                 "text": text,
                 "type": type,  # 'voice' or 'sign'
                 "user_id": user_id,
@@ -49,16 +89,74 @@ class CaptionService:
             logging.error(f"Error creating caption: {str(e)}")
             return None
 
+    def next_caption_id(self) -> str:
+        """
+        Generate a UUID-formatted caption id that is unique across processes without reading /dev/urandom
+        """
+        return str(uuid.UUID(int=PROCESS_ID | (next(self._next_id) & 0xFFFFFFFF), version=4))
+
+    def reset_indexes(self):
+        """
+        Reset the per-user, per-type and per-language caption indexes and running statistics
+        """
+        self._by_user = defaultdict(deque)
+        self._by_type = defaultdict(deque)
+        self._by_language = defaultdict(deque)
+        self._type_counts = Counter()
+        self._language_counts = Counter()
+        self._user_counts = Counter()
+        
+        # Confidence column as a ring buffer parallel to caption_history
+        self._confidences = np.zeros(self.max_history, dtype=np.float32)
+        self._captions_added = 0
+
+    def update_statistics(self, caption: Dict[str, Any], delta: int):
+        """
+        Add (delta=1) or remove (delta=-1) a caption from the running counts
+        """
+        for counter, key in (
+            (self._type_counts, caption.get("type")),
+            (self._language_counts, caption.get("language", "unknown")),
+            (self._user_counts, caption.get("user_id", "unknown"))
+        ):
+            counter[key] += delta
+            if not counter[key]:
+                del counter[key]
+
+    def index_entries(self, caption: Dict[str, Any]):
+        """
+        Get the (index, key) pairs a caption is filed under
+        """
+        return (
+            (self._by_user, caption.get("user_id")),
+            (self._by_type, caption.get("type")),
+            (self._by_language, caption.get("language"))
+        )
+
     def add_to_history(self, caption: Dict[str, Any]):
         """
         Add caption to history
         """
         try:
+            # The bounded deque drops the oldest caption once full
+            if len(self.caption_history) == self.max_history:
+                # Evicted captions are always the oldest entry of each index they are in
+                evicted = self.caption_history[0]
+                for index, key in self.index_entries(evicted):
+                    entries = index[key]
+                    entries.popleft()
+                    if not entries:
+                        del index[key]
+                self.update_statistics(evicted, -1)
+            
             self.caption_history.append(caption)
+            for index, key in self.index_entries(caption):
+                index[key].append(caption)
+            self.update_statistics(caption, 1)
             
-            # Keep only the last N captions
-            if len(self.caption_history) > self.max_history:
-                self.caption_history = self.caption_history[-self.max_history:]
+            # Overwrites the evicted caption's slot once the history is full
+            self._confidences[self._captions_added % self.max_history] = caption.get("confidence", 0)
+            self._captions_added += 1
                 
         except Exception as e:
             logging.error(f"Error adding caption to history: {str(e)}")
@@ -68,7 +166,7 @@ class CaptionService:
         Get caption history
         """
         try:
-            return self.caption_history[-limit:] if limit else self.caption_history
+            return tail(self.caption_history, limit)
             
         except Exception as e:
             logging.error(f"Error getting caption history: {str(e)}")
@@ -79,8 +177,7 @@ class CaptionService:
         Get captions by specific user
         """
         try:
-            user_captions = [c for c in self.caption_history if c.get("user_id") == user_id]
-            return user_captions[-limit:] if limit else user_captions
+            return tail(self._by_user.get(user_id, ()), limit)
             
         except Exception as e:
             logging.error(f"Error getting captions by user: {str(e)}")
@@ -91,8 +188,7 @@ class CaptionService:
         Get captions by type (voice or sign)
         """
         try:
-            type_captions = [c for c in self.caption_history if c.get("type") == caption_type]
-            return type_captions[-limit:] if limit else type_captions
+            return tail(self._by_type.get(caption_type, ()), limit)
             
         except Exception as e:
             logging.error(f"Error getting captions by type: {str(e)}")
@@ -103,8 +199,7 @@ class CaptionService:
         Get captions by language
         """
         try:
-            language_captions = [c for c in self.caption_history if c.get("language") == language]
-            return language_captions[-limit:] if limit else language_captions
+            return tail(self._by_language.get(language, ()), limit)
             
         except Exception as e:
             logging.error(f"Error getting captions by language: {str(e)}")
@@ -122,7 +217,7 @@ class CaptionService:
             
             if translated_text:
                 translated_caption = caption.copy()
-                translated_caption["id"] = str(uuid.uuid4())
+                translated_caption["id"] = self.next_caption_id()
                 translated_caption["text"] = translated_text
                 translated_caption["language"] = target_language
                 translated_caption["timestamp"] = datetime.now().isoformat()
@@ -141,41 +236,7 @@ class CaptionService:
         """
         Simulate translation for demonstration
         """
-        # Simple translation mapping for demonstration
-        translations = {
-            "en": {
-                "ta": {
-                    "Hello everyone": "வணக்கம் அனைவருக்கும்",
-                    "Thank you": "நன்றி",
-                    "Yes": "ஆம்",
-                    "No": "இல்லை",
-                    "Please": "தயவு செய்து",
-                    "Sorry": "மன்னிக்கவும்"
-                },
-                "ml": {
-                    "Hello everyone": "ഹലോ എല്ലാവർക്കും",
-                    "Thank you": "നന്ദി",
-                    "Yes": "അതെ",
-                    "No": "ഇല്ല",
-                    "Please": "ദയവായി",
-                    "Sorry": "ക്ഷമിക്കണം"
-                },
-                "te": {
-                    "Hello everyone": "హలో అందరికీ",
-                    "Thank you": "ధన్యవాదాలు",
-                    "Yes": "అవును",
-                    "No": "కాదు",
-                    "Please": "దయచేసి",
-                    "Sorry": "క్షమించండి"
-                }
-            }
-        }
-        
-        # Check if translation exists
-        if target_language in translations.get("en", {}):
-            return translations["en"][target_language].get(text, text)
-        
-        return text
+        return TRANSLATIONS.get((text, target_language), text)
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -183,43 +244,14 @@ class CaptionService:
         """
         try:
             total_captions = len(self.caption_history)
-            
-            if total_captions == 0:
-                return {
-                    "total_captions": 0,
-                    "voice_captions": 0,
-                    "sign_captions": 0,
-                    "languages": {},
-                    "users": {},
-                    "average_confidence": 0.0
-                }
-            
-            # Count by type
-            voice_captions = len([c for c in self.caption_history if c.get("type") == "voice"])
-            sign_captions = len([c for c in self.caption_history if c.get("type") == "sign"])
-            
-            # Count by language
-            languages = {}
-            for caption in self.caption_history:
-                lang = caption.get("language", "unknown")
-                languages[lang] = languages.get(lang, 0) + 1
-            
-            # Count by user
-            users = {}
-            for caption in self.caption_history:
-                user_id = caption.get("user_id", "unknown")
-                users[user_id] = users.get(user_id, 0) + 1
-            
-            # Calculate average confidence
-            confidences = [c.get("confidence", 0) for c in self.caption_history]
-            average_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            average_confidence = float(self._confidences[:total_captions].mean()) if total_captions else 0.0
             
             return {
                 "total_captions": total_captions,
-                "voice_captions": voice_captions,
-                "sign_captions": sign_captions,
-                "languages": languages,
-                "users": users,
+                "voice_captions": self._type_counts["voice"],
+                "sign_captions": self._type_counts["sign"],
+                "languages": dict(self._language_counts),
+                "users": dict(self._user_counts),
                 "average_confidence": round(average_confidence, 3)
             }
             
@@ -232,7 +264,8 @@ class CaptionService:
         Clear caption history
         """
         try:
-            self.caption_history = []
+            self.caption_history.clear()
+            self.reset_indexes()
             logging.info("Caption history cleared")
             
         except Exception as e:
@@ -242,14 +275,16 @@ class CaptionService:
         """
         Check if the service is ready
         """
-        return self.is_ready
+        return self._ready
 
     def cleanup(self):
         """
         Cleanup resources
         """
         try:
-            self.caption_history = []
+            self._ready = False
+            self.caption_history.clear()
+            self.reset_indexes()
             logging.info("Caption Service cleaned up")
             
         except Exception as e:
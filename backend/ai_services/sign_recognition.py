@@ -1,26 +1,83 @@
-import cv2
+import asyncio
 import numpy as np
-import mediapipe as mp
-import tensorflow as tf
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# cv2, mediapipe and tensorflow are imported where they are first needed so that
+# importing this module stays cheap; TYPE_CHECKING keeps the annotations resolvable
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+# Try to import Numba for the landmark normalization kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.warning("Numba not available, normalizing landmarks with NumPy")
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def normalize_landmarks(raw, out):
+        """
+        Center flat x, y, z landmark triplets on the wrist and scale by the farthest landmark
+        """
+        n = raw.shape[0] // 3
+        max_norm = np.float32(0.0)
+        for i in range(n):
+            dx = raw[3 * i] - raw[0]
+            dy = raw[3 * i + 1] - raw[1]
+            dz = raw[3 * i + 2] - raw[2]
+            out[3 * i] = dx
+            out[3 * i + 1] = dy
+            out[3 * i + 2] = dz
+            max_norm = max(max_norm, np.sqrt(dx * dx + dy * dy + dz * dz))
+        if max_norm > 0:
+            for j in range(3 * n):
+                out[j] /= max_norm
+        return out
+else:
+    def normalize_landmarks(raw, out):
+        """
+        Center flat x, y, z landmark triplets on the wrist and scale by the farthest landmark
+        """
+        points = out.reshape(-1, 3)
+        np.subtract(raw.reshape(-1, 3), raw[:3], out=points)
+        max_norm = np.sqrt((points * points).sum(axis=1)).max()
+        if max_norm > 0:
+            out /= max_norm
+        return out
+
+class SignSession:
+    """
+    Per-connection state for the static-hand shortcut, kept apart from the shared
+    recognizer so one client's last prediction is never returned for another's frame
+    """
+    def __init__(self):
+        self.last_bbox = None
+        self.last_sign = None
+
 class SignLanguageRecognizer:
     def __init__(self):
+        import mediapipe as mp
+        
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
-        
-        # Load the trained CNN model
-        self.model = self.load_model()
-        self.is_model_ready = self.model is not None
+        self.hand_landmarker = self.create_hand_landmarker()
+        self._last_timestamp_ms = 0
+        if self.hand_landmarker is None:
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=2,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
         
         # ASL alphabet mapping
         self.asl_alphabet = {
@@ -45,16 +102,117 @@ class SignLanguageRecognizer:
             'HOME': ['H', 'O', 'M', 'E']
         }
         
-        self.sequence_buffer = []
+        # Phrase patterns joined once so matching is a substring search
+        self.phrase_strings = [(phrase, ''.join(pattern)) for phrase, pattern in self.common_phrases.items()]
+        
+        # Every prefix of every phrase pattern, to rule out a match from the buffer tail alone
+        self._phrase_prefixes = {
+            pattern[:k] for _, pattern in self.phrase_strings for k in range(1, len(pattern) + 1)
+        }
+        self._max_pattern_length = max(len(pattern) for _, pattern in self.phrase_strings)
+        
         self.max_sequence_length = 10
+        self.sequence_buffer = deque(maxlen=self.max_sequence_length)
+        
+        # Per-frame buffers reused across calls
+        self._landmark_buf = np.empty(21 * 3, dtype=np.float32)
+        self._normalized_buf = np.empty(21 * 3, dtype=np.float32)
+        self._rgb_buf = None
+        self._small28 = np.empty((28, 28, 3), dtype=np.uint8)
+        self._gray28 = np.empty((28, 28), dtype=np.uint8)
+        self._asl_in = np.empty((1, 28, 28, 1), dtype=np.float32)
+        self._asl_in_q = np.empty((1, 28, 28, 1), dtype=np.int8)
+        self._quantize_lut = None  # uint8 pixel -> int8 model input, set for quantized models
+        self._use_opencl = None  # Resolved on first use, once cv2 is imported
+        
+        # Prediction reuse for static hands; the pose cache is content-addressed and shared,
+        # while the last bbox/sign live on each connection's SignSession
+        self._pred_cache = OrderedDict()  # rounded landmarks -> sign, LRU
+        self.pred_cache_size = 64
+        self.bbox_epsilon = 0.005  # Max landmark bbox movement, in normalized image coordinates
+        
+        # Cross-request batching of model calls, started on first use
+        self._batch_queue = None
+        self._batch_task = None
+        self.max_batch_size = 16
+        self.batch_window = 0.01  # Seconds to wait for more frames after the first one
+        self.tflite_batch_sizes = (1, 4, self.max_batch_size)  # Batches are padded up to one of these
+        
+        # Batched model calls run here, off the event loop; one thread, since each batch
+        # already uses every core inside TensorFlow/TFLite
+        self._infer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asl")
+        
+        # Simulated signs, drawn from a pregenerated pool of random indices
+        self._sim_signs = ('HELLO', 'THANK YOU', 'YES', 'NO', 'PLEASE', 'SORRY', 'GOOD', 'BAD', 'HELP')
+        self._sim_rng = np.random.default_rng()
+        self._sim_idx = iter(())
+        
+        # Load the trained CNN model, preferring the int8 TFLite export
+        self.model = None
+        self._infer = self.load_tflite_model()
+        if self._infer is None:
+            self.model = self.load_model()
+            self._infer = self.build_inference_function(self.model) if self.model is not None else None
+        self.is_model_ready = self._infer is not None
+        self._warned_not_ready = False
         
         logging.info("Sign Language Recognizer initialized")
 
-    def load_model(self) -> Optional[tf.keras.Model]:
+    def create_hand_landmarker(self):
+        """
+        Create a MediaPipe Tasks HandLandmarker from models/hand_landmarker.task.
+        Returns None when the task file is missing so the legacy Hands solution is used.
+        """
+        try:
+            task_path = os.path.join(os.path.dirname(__file__), '..', 'models', 'hand_landmarker.task')
+            
+            if not os.path.exists(task_path):
+                return None
+            
+            from mediapipe.tasks.python import BaseOptions
+            from mediapipe.tasks.python.vision import HandLandmarker, HandLandmarkerOptions, RunningMode
+            
+            # VIDEO mode keeps tracking between frames and returns results synchronously,
+            # which each recognize() call needs for its own frame
+            options = HandLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=task_path),
+                running_mode=RunningMode.VIDEO,
+                num_hands=2,
+                min_hand_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+            hand_landmarker = HandLandmarker.create_from_options(options)
+            logging.info("MediaPipe HandLandmarker loaded from hand_landmarker.task")
+            return hand_landmarker
+            
+        except Exception as e:
+            logging.error("Error creating HandLandmarker: %s", e)
+            return None
+
+    def detect_hand_landmarks(self, rgb_image: np.ndarray):
+        """
+        Run hand detection and return the first hand's landmarks, or None
+        """
+        if self.hand_landmarker is not None:
+            import mediapipe as mp
+            
+            # VIDEO mode requires strictly increasing timestamps
+            timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+            self._last_timestamp_ms = timestamp_ms
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
+            result = self.hand_landmarker.detect_for_video(mp_image, timestamp_ms)
+            return result.hand_landmarks[0] if result.hand_landmarks else None
+        
+        results = self.hands.process(rgb_image)
+        return results.multi_hand_landmarks[0].landmark if results.multi_hand_landmarks else None
+
+    def load_model(self) -> Optional["tf.keras.Model"]:
         """
         Load the pre-trained ASL CNN model from Kaggle dataset
         """
         try:
+            import tensorflow as tf
+            
             # Load the pre-trained ASL model
             model_path = os.path.join(os.path.dirname(__file__), '..', 'models', 'asl_model.h5')
             
@@ -63,17 +221,111 @@ class SignLanguageRecognizer:
                 logging.info("Pre-trained ASL model loaded successfully from asl_model.h5")
                 return model
             else:
-                logging.error(f"ASL model not found at {model_path}")
+                logging.error("ASL model not found at %s", model_path)
+                return None
+                
+        except Exception as e:
+            logging.error("Error loading ASL model: %s", e)
+            return None
+
+    def load_tflite_model(self):
+        """
+        Load the int8 TFLite ASL model produced by quantize_asl_model.py, if present
+        """
+        try:
+            tflite_path = os.path.join(os.path.dirname(__file__), '..', 'models', 'asl_model_int8.tflite')
+            
+            if not os.path.exists(tflite_path):
+                return None
+            
+            import tensorflow as tf
+            
+            def create_interpreter(batch_size: Optional[int] = None):
+                interpreter = tf.lite.Interpreter(model_path=tflite_path, num_threads=os.cpu_count())
+                if batch_size is not None:
+                    interpreter.resize_tensor_input(
+                        interpreter.get_input_details()[0]['index'], (batch_size, 28, 28, 1)
+                    )
+                interpreter.allocate_tensors()
+                return interpreter
+            
+            interpreter = create_interpreter()
+            input_details = interpreter.get_input_details()[0]
+            output_details = interpreter.get_output_details()[0]
+            in_scale, in_zero = input_details['quantization']
+            out_scale, out_zero = output_details['quantization']
+            
+            # A float model saved under this name has zero scales, which would turn every
+            # input into inf and every output into zeros without raising
+            if (input_details['dtype'] != np.int8 or output_details['dtype'] != np.int8
+                    or in_scale <= 0 or out_scale <= 0):
+                logging.warning("asl_model_int8.tflite is not an int8-quantized model, using the Keras model")
                 return None
+            
+            # Map every uint8 pixel straight to its quantized input value
+            self._quantize_lut = np.clip(
+                np.round(np.arange(256) / 255.0 / in_scale + in_zero), -128, 127
+            ).astype(np.int8)
+            
+            # Reallocating tensors whenever the batch size changes would happen on nearly
+            # every batch, so keep one interpreter per padded batch size, allocated once
+            batch_sizes = sorted(set(self.tflite_batch_sizes))
+            interpreters = {int(input_details['shape'][0]): interpreter}
+            inputs = {}
+            lock = threading.Lock()
+            
+            def infer(x: np.ndarray) -> np.ndarray:
+                outputs = []
+                for start in range(0, len(x), batch_sizes[-1]):
+                    part = x[start:start + batch_sizes[-1]]
+                    size = next(size for size in batch_sizes if size >= len(part))
+                    
+                    with lock:
+                        if size not in interpreters:
+                            interpreters[size] = create_interpreter(size)
+                        if size not in inputs:
+                            inputs[size] = np.zeros((size, 28, 28, 1), dtype=input_details['dtype'])
+                        
+                        # Pad with zero frames up to the bucket size
+                        padded = inputs[size]
+                        padded[:len(part)] = part
+                        padded[len(part):] = 0
+                        
+                        bucket = interpreters[size]
+                        bucket.set_tensor(input_details['index'], padded)
+                        bucket.invoke()
+                        output = bucket.get_tensor(output_details['index'])[:len(part)]
+                        outputs.append((output.astype(np.float32) - out_zero) * out_scale)
                 
+                return np.concatenate(outputs)
+            
+            logging.info("Quantized ASL model loaded successfully from asl_model_int8.tflite")
+            return infer
+            
         except Exception as e:
-            logging.error(f"Error loading ASL model: {str(e)}")
+            logging.error("Error loading quantized ASL model: %s", e)
+            self._quantize_lut = None
             return None
 
-    def create_simple_model(self) -> tf.keras.Model:
+    def build_inference_function(self, model: "tf.keras.Model"):
+        """
+        Trace the model once into a concrete graph function for batched inference,
+        avoiding the per-call overhead of model.predict()
+        """
+        import tensorflow as tf
+        
+        concrete = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec((None, 28, 28, 1), tf.float32)]
+        ).get_concrete_function()
+        return lambda x: concrete(tf.constant(x)).numpy()
+
+    def create_simple_model(self) -> "tf.keras.Model":
         """
         Create a simple CNN model for demonstration
         """
+        import tensorflow as tf
+        
         model = tf.keras.Sequential([
             tf.keras.layers.Conv2D(32, (3, 3), activation='relu', input_shape=(64, 64, 3)),
             tf.keras.layers.MaxPooling2D(2, 2),
@@ -93,108 +345,240 @@ class SignLanguageRecognizer:
         
         return model
 
-    def extract_hand_features(self, image: np.ndarray) -> Optional[np.ndarray]:
+    def extract_hand_features(self, image: np.ndarray, pixel_format: str = "BGR") -> Optional[np.ndarray]:
         """
-        Extract hand landmarks and features from image
+        Extract hand landmarks and features from image (BGR, or RGB with pixel_format="RGB").
+        The returned array is a reused buffer that is overwritten on the next call.
         """
+        import cv2
+        
         try:
-            # Convert BGR to RGB
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            if pixel_format == "RGB":
+                # Already in MediaPipe's channel order
+                rgb_image = image
+            else:
+                # Convert BGR to RGB into a buffer reused while the frame size stays the same
+                if self._rgb_buf is None or self._rgb_buf.shape != image.shape:
+                    self._rgb_buf = np.empty_like(image)
+                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
             
-            # Process the image
-            results = self.hands.process(rgb_image)
+            # Process the image and get the first hand
+            hand_landmarks = self.detect_hand_landmarks(rgb_image)
             
-            if results.multi_hand_landmarks:
-                # Get the first hand
-                hand_landmarks = results.multi_hand_landmarks[0]
-                
+            if hand_landmarks is not None:
                 # Extract landmark coordinates
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y, landmark.z])
+                landmarks = self._landmark_buf
+                for i, landmark in enumerate(hand_landmarks):
+                    landmarks[3 * i] = landmark.x
+                    landmarks[3 * i + 1] = landmark.y
+                    landmarks[3 * i + 2] = landmark.z
                 
-                return np.array(landmarks)
+                return landmarks
             
             return None
             
         except Exception as e:
-            logging.error(f"Error extracting hand features: {str(e)}")
+            logging.error("Error extracting hand features: %s", e)
             return None
 
-    def preprocess_image_for_asl(self, image: np.ndarray) -> np.ndarray:
+    def preprocess_image_for_asl(self, image: np.ndarray, pixel_format: str = "BGR") -> np.ndarray:
         """
-        Preprocess image for ASL model input (28x28 grayscale)
+        Preprocess image for ASL model input (28x28 grayscale).
+        Writes into a preallocated (1, 28, 28, 1) buffer that is reused on the next call.
         """
+        import cv2
+        
         try:
-            # Convert to grayscale
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
+            to_gray = cv2.COLOR_RGB2GRAY if pixel_format == "RGB" else cv2.COLOR_BGR2GRAY
             
-            # Resize to 28x28 (ASL model input size)
-            resized = cv2.resize(gray, (28, 28))
+            if self._use_opencl is None:
+                self._use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
             
-            # Normalize pixel values to 0-1
-            normalized = resized.astype(np.float32) / 255.0
+            if self._use_opencl:
+                # Resize and convert on the GPU, downloading only the 784 output pixels
+                frame = cv2.resize(cv2.UMat(image), (28, 28))
+                if len(image.shape) == 3:
+                    frame = cv2.cvtColor(frame, to_gray)
+                self._gray28[...] = frame.get()
+            elif len(image.shape) == 3:
+                # Resize to 28x28 (ASL model input size) first, then convert only 784 pixels
+                cv2.resize(image, (28, 28), dst=self._small28)
+                cv2.cvtColor(self._small28, to_gray, dst=self._gray28)
+            else:
+                cv2.resize(image, (28, 28), dst=self._gray28)
             
-            # Reshape for model input (28, 28, 1)
-            reshaped = np.expand_dims(normalized, axis=-1)
+            if self._quantize_lut is not None:
+                # Quantized model: look up int8 inputs directly, no float pass
+                np.take(self._quantize_lut, self._gray28, out=self._asl_in_q[0, :, :, 0])
+                return self._asl_in_q
             
-            # Add batch dimension
-            return np.expand_dims(reshaped, axis=0)
+            # Normalize pixel values to 0-1 straight into the model input tensor
+            np.multiply(self._gray28, np.float32(1 / 255.0), out=self._asl_in[0, :, :, 0])
+            
+            return self._asl_in
         except Exception as e:
-            logging.error(f"Error preprocessing image for ASL: {str(e)}")
+            logging.error("Error preprocessing image for ASL: %s", e)
             return None
 
-    def predict_sign(self, image: np.ndarray) -> Optional[str]:
+    def predict_sign(self, image: np.ndarray, pixel_format: str = "BGR") -> Optional[str]:
         """
         Predict sign language from image using pre-trained ASL model
         """
         try:
-            if not self.is_model_ready or self.model is None:
-                logging.warning("ASL model not ready, using simulation")
+            if not self.is_model_ready or self._infer is None:
+                self.warn_model_not_ready()
                 return self.simulate_prediction()
             
             # Preprocess image for ASL model (28x28 grayscale)
-            processed_image = self.preprocess_image_for_asl(image)
+            processed_image = self.preprocess_image_for_asl(image, pixel_format)
             if processed_image is None:
                 return None
             
             # Make prediction
-            predictions = self.model.predict(processed_image, verbose=0)
-            predicted_class = np.argmax(predictions[0])
-            confidence = np.max(predictions[0])
+            predictions = self._infer(processed_image)
+            return self.decode_prediction(predictions[0])
             
-            # Only return prediction if confidence is high enough
-            if confidence > 0.7:
-                return self.asl_alphabet.get(predicted_class, 'UNKNOWN')
+        except Exception as e:
+            logging.error("Error predicting sign: %s", e)
+            return self.simulate_prediction()
+
+    def warn_model_not_ready(self):
+        """
+        Log that the model is missing once, rather than on every simulated frame
+        """
+        if not self._warned_not_ready:
+            self._warned_not_ready = True
+            logging.warning("ASL model not ready, using simulation")
+
+    def decode_prediction(self, probabilities: np.ndarray) -> Optional[str]:
+        """
+        Map one row of class probabilities to a sign
+        """
+        predicted_class = int(np.argmax(probabilities))
+        confidence = probabilities[predicted_class]
+        
+        # Only return prediction if confidence is high enough
+        if confidence > 0.7:
+            return self.asl_alphabet.get(predicted_class, 'UNKNOWN')
+        
+        return None
+
+    async def predict_sign_batched(self, image: np.ndarray, pixel_format: str = "BGR") -> Optional[str]:
+        """
+        Predict sign language from image, sharing one model call with other
+        frames that arrive within the same batching window
+        """
+        try:
+            if not self.is_model_ready or self._infer is None:
+                self.warn_model_not_ready()
+                return self.simulate_prediction()
             
-            return None
+            # Copy out of the shared preprocessing buffer before yielding to other requests
+            processed_image = self.preprocess_image_for_asl(image, pixel_format)
+            if processed_image is None:
+                return None
+            processed_image = processed_image.copy()
+            
+            loop = asyncio.get_running_loop()
+            if self._batch_queue is None or self._batch_task is None or self._batch_task.done():
+                self._batch_queue = asyncio.Queue()
+                self._batch_task = loop.create_task(self.run_batch_worker(self._batch_queue))
+            
+            future = loop.create_future()
+            await self._batch_queue.put((processed_image, future))
+            return self.decode_prediction(await future)
             
         except Exception as e:
-            logging.error(f"Error predicting sign: {str(e)}")
+            logging.error("Error predicting sign: %s", e)
             return self.simulate_prediction()
 
+    async def run_batch_worker(self, batch_queue: asyncio.Queue):
+        """
+        Collect queued frames for up to batch_window seconds (or max_batch_size frames)
+        and run them through the model in a single call
+        """
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await batch_queue.get()]
+            deadline = loop.time() + self.batch_window
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                # Run the model on a worker thread so other connections keep being served
+                predictions = await loop.run_in_executor(
+                    self._infer_executor, self._infer, np.concatenate([image for image, _ in batch])
+                )
+                for (_, future), probabilities in zip(batch, predictions):
+                    if not future.done():
+                        future.set_result(probabilities)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def predict_sign_for_landmarks(
+        self, 
+        image: np.ndarray, 
+        landmarks: np.ndarray, 
+        pixel_format: str = "BGR",
+        session: Optional[SignSession] = None
+    ) -> Optional[str]:
+        """
+        Predict sign language, reusing earlier predictions when the session's hand has
+        not moved or its landmarks match a recently seen pose
+        """
+        if not self.is_model_ready:
+            return self.predict_sign(image, pixel_format)
+        
+        points = landmarks.reshape(-1, 3)[:, :2]
+        bbox = np.concatenate((points.min(axis=0), points.max(axis=0)))
+        
+        # Hand held still: reuse the last prediction without touching the model
+        if (session is not None and session.last_bbox is not None
+                and np.abs(bbox - session.last_bbox).max() < self.bbox_epsilon):
+            return session.last_sign
+        
+        # Key on the hand pose alone, independent of where the hand is and how large it appears
+        key = normalize_landmarks(landmarks, self._normalized_buf).round(2).tobytes()
+        if key in self._pred_cache:
+            self._pred_cache.move_to_end(key)
+            sign = self._pred_cache[key]
+        else:
+            sign = await self.predict_sign_batched(image, pixel_format)
+            self._pred_cache[key] = sign
+            if len(self._pred_cache) > self.pred_cache_size:
+                self._pred_cache.popitem(last=False)
+        
+        if session is not None:
+            session.last_bbox = bbox
+            session.last_sign = sign
+        return sign
+
     def simulate_prediction(self) -> str:
         """
         Simulate sign language prediction for demonstration
         """
-        import random
-        
-        # Simulate some common signs
-        signs = ['HELLO', 'THANK YOU', 'YES', 'NO', 'PLEASE', 'SORRY', 'GOOD', 'BAD', 'HELP']
-        return random.choice(signs)
+        try:
+            return self._sim_signs[next(self._sim_idx)]
+        except StopIteration:
+            self._sim_idx = iter(self._sim_rng.integers(0, len(self._sim_signs), size=4096).tolist())
+            return self._sim_signs[next(self._sim_idx)]
 
     def update_sequence_buffer(self, sign: str):
         """
         Update the sequence buffer with new sign
         """
+        # The bounded deque keeps only the last N signs
         self.sequence_buffer.append(sign)
-        
-        # Keep only the last N signs
-        if len(self.sequence_buffer) > self.max_sequence_length:
-            self.sequence_buffer = self.sequence_buffer[-self.max_sequence_length:]
 
     def recognize_phrase(self) -> Optional[str]:
         """
@@ -206,40 +590,41 @@ class SignLanguageRecognizer:
         # Convert sequence to string
         sequence_str = ''.join(self.sequence_buffer)
         
+        # The buffer minus its newest sign was already scanned, so a new match has to end
+        # at the tail; skip the scan when no tail of the sequence starts any phrase
+        if len(self.sequence_buffer) > 3:
+            tail = sequence_str[-self._max_pattern_length:]
+            if not any(tail[k:] in self._phrase_prefixes for k in range(len(tail))):
+                return None
+        
         # Check for common phrases
-        for phrase, pattern in self.common_phrases.items():
-            if self.sequence_matches_pattern(sequence_str, pattern):
+        for phrase, pattern in self.phrase_strings:
+            if pattern in sequence_str:
                 # Clear buffer after recognizing phrase
-                self.sequence_buffer = []
+                self.sequence_buffer.clear()
                 return phrase
         
         return None
 
-    def sequence_matches_pattern(self, sequence: str, pattern: list) -> bool:
-        """
-        Check if sequence matches a pattern
-        """
-        if len(sequence) < len(pattern):
-            return False
-        
-        # Simple pattern matching
-        for i in range(len(sequence) - len(pattern) + 1):
-            if sequence[i:i+len(pattern)] == pattern:
-                return True
-        
-        return False
-
-    async def recognize(self, image: np.ndarray, language: str = "en") -> Optional[str]:
+    async def recognize(
+        self, 
+        image: np.ndarray, 
+        language: str = "en", 
+        pixel_format: str = "BGR", 
+        session: Optional[SignSession] = None
+    ) -> Optional[str]:
         """
-        Main recognition function
+        Main recognition function. Frames are BGR by default; pass pixel_format="RGB"
+        for frames decoded straight to RGB to skip the color conversion. Pass the
+        connection's SignSession to reuse its prediction while the hand is held still.
         """
         try:
             # Extract hand features
-            features = self.extract_hand_features(image)
+            features = self.extract_hand_features(image, pixel_format)
             
             if features is not None:
                 # Predict sign
-                sign = self.predict_sign(image)
+                sign = await self.predict_sign_for_landmarks(image, features, pixel_format, session)
                 
                 if sign and sign != 'NOTHING':
                     # Update sequence buffer
@@ -257,7 +642,7 @@ class SignLanguageRecognizer:
             return None
             
         except Exception as e:
-            logging.error(f"Error in sign recognition: {str(e)}")
+            logging.error("Error in sign recognition: %s", e)
             return None
 
     def is_ready(self) -> bool:
@@ -276,6 +661,12 @@ class SignLanguageRecognizer:
         """
         Cleanup resources
         """
+        if getattr(self, '_batch_task', None) is not None:
+            self._batch_task.cancel()
+        if getattr(self, '_infer_executor', None) is not None:
+            self._infer_executor.shutdown(wait=False)
+        if getattr(self, 'hand_landmarker', None) is not None:
+            self.hand_landmarker.close()
         if hasattr(self, 'hands'):
             self.hands.close()
         logging.info("Sign Language Recognizer cleaned up")
@@ -3,9 +3,16 @@ import logging
 import os
 import io
 import wave
-import json
-from typing import Optional, Dict, Any
+import orjson
+import math
+import queue
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 import numpy as np
+from scipy.signal import resample_poly
 from datetime import datetime
 
 # Try to import Vosk (offline speech recognition)
@@ -24,15 +31,125 @@ except ImportError:
     GOOGLE_SPEECH_AVAILABLE = False
     logging.warning("Google Cloud Speech not available")
 
+# Sample phrases in different languages for simulated transcription
+SIMULATED_PHRASES = {
+    "en": (
+        "Hello everyone, how are you doing?",
+        "Thank you for joining the meeting",
+        "Can you hear me clearly?",
+        "Yes, I can hear you perfectly",
+        "Let's discuss the project updates",
+        "I agree with your proposal",
+        "That sounds like a great idea",
+        "Could you please repeat that?",
+        "I'm having trouble with my connection",
+        "The presentation looks good"
+    ),
+    "ta": (
+        "வணக்கம் அனைவருக்கும்",
+        "கூட்டத்தில் சேர்ந்ததற்கு நன்றி",
+        "நீங்கள் என்னை கேட்க முடிகிறதா?",
+        "ஆம், நான் உங்களை தெளிவாக கேட்கிறேன்"
+    ),
+    "ml": (
+        "ഹലോ എല്ലാവർക്കും",
+        "മീറ്റിംഗിൽ ചേർന്നതിന് നന്ദി",
+        "നിങ്ങൾ എന്നെ കേൾക്കാൻ കഴിയുമോ?",
+        "അതെ, ഞാൻ നിങ്ങളെ വ്യക്തമായി കേൾക്കുന്നു"
+    ),
+    "te": (
+        "హలో అందరికీ",
+        "మీటింగ్‌లో చేరినందుకు ధన్యవాదాలు",
+        "మీరు నన్ను వినగలరా?",
+        "అవును, నేను మిమ్మల్ని స్పష్టంగా వింటున్నాను"
+    )
+}
+
+class StreamingResampler:
+    """
+    Polyphase resampler for 16-bit PCM that arrives in chunks. Each chunk is filtered
+    together with the tail of the one before, so the output is the same as resampling
+    the whole signal at once instead of restarting the filter at every chunk boundary.
+    """
+    def __init__(self, from_rate: int, to_rate: int):
+        common = math.gcd(from_rate, to_rate)
+        self.up = to_rate // common
+        self.down = from_rate // common
+        
+        # resample_poly's default filter reaches 10 * max(up, down) upsampled samples to
+        # each side. Keep that much input on both sides of the samples being resampled,
+        # rounded up to whole multiples of down so every boundary falls on an output sample
+        reach = 10 * max(self.up, self.down) // self.up + 2
+        self.margin = -(-reach // self.down) * self.down
+        
+        # Input from margin samples before the next output onwards; the leading zeros are
+        # the same padding resample_poly applies at the start of a signal
+        self._pending = np.zeros(self.margin, dtype=np.float32)
+        self._consumed = 0  # Input samples whose outputs have been returned
+        self._received = 0
+        self._emitted = 0
+    
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk, returning the int16 output that no longer depends on later input
+        """
+        buf = np.concatenate((self._pending, samples.astype(np.float32)))
+        self._received += len(samples)
+        
+        start = self._consumed - self.margin
+        stop = (start + len(buf) - self.margin) // self.down * self.down
+        if stop <= self._consumed:
+            self._pending = buf
+            return np.empty(0, dtype=np.int16)
+        
+        out = self.resample(buf[:stop - start + self.margin], (stop - self._consumed) * self.up // self.down)
+        self._pending = buf[stop - self.margin - start:]
+        self._consumed = stop
+        return out
+    
+    def flush(self) -> np.ndarray:
+        """
+        Return the rest of the output once all input has been processed
+        """
+        buf = np.concatenate((self._pending, np.zeros(self.margin, dtype=np.float32)))
+        return self.resample(buf, -(-self._received * self.up // self.down) - self._emitted)
+    
+    def resample(self, buf: np.ndarray, count: int) -> np.ndarray:
+        """
+        Resample buf and take count outputs, starting after the leading margin
+        """
+        first = self.margin * self.up // self.down
+        out = resample_poly(buf, self.up, self.down)[first:first + count]
+        np.clip(out, -32768, 32767, out=out)
+        self._emitted += len(out)
+        return out.astype(np.int16)
+
 class VoiceRecognizer:
     def __init__(self):
-        self.vosk_model = None
+        self.vosk_model_paths = {}
+        self.default_vosk_language = None
         self.google_client = None
-        self.is_ready = False
+        self.target_sample_rate = 16000
+        
+        # Blocking Vosk/Google calls run here
+        self._stt_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="stt")
+        
+        # Pools of idle KaldiRecognizers keyed by (language, sample_rate). A recognizer decodes
+        # on one core, so a few per language let concurrent requests use several cores.
+        self._recognizer_pools = {}
+        self._recognizer_pools_lock = threading.Lock()
+        self.recognizers_per_language = min(os.cpu_count() or 1, 4)
+        
+        # Vosk models are loaded on first use; only the most recently used few stay in memory
+        self._vosk_models = OrderedDict()  # language -> vosk.Model, LRU
+        self._vosk_loading = {}  # language -> Future for a load in progress
+        self._vosk_models_lock = threading.Lock()  # Guards lookups and inserts, not loading
+        self.max_loaded_models = 2
         
         # Initialize services
         self.initialize_vosk()
         self.initialize_google_speech()
+        self._ready = bool(self.vosk_model_paths) or self.google_client is not None
         
         # Language mapping
         self.language_codes = {
@@ -46,14 +163,12 @@ class VoiceRecognizer:
 
     def initialize_vosk(self):
         """
-        Initialize Vosk offline speech recognition with pre-trained models
+        Find the pre-trained Vosk models for each language; they are loaded on first use
         """
         if not VOSK_AVAILABLE:
             return
         
         try:
-            # Load pre-trained Vosk models for different languages
-            self.vosk_models = {}
             models_dir = os.path.join(os.path.dirname(__file__), '..', 'models', 'vosk')
             
             # Model mappings for different languages
@@ -67,23 +182,107 @@ class VoiceRecognizer:
             for lang, model_name in model_mappings.items():
                 model_path = os.path.join(models_dir, model_name)
                 if os.path.exists(model_path):
-                    self.vosk_models[lang] = vosk.Model(model_path)
-                    logging.info(f"Vosk {lang} model loaded successfully from {model_path}")
+                    self.vosk_model_paths[lang] = model_path
+                    logging.info(f"Vosk {lang} model found at {model_path}")
                 else:
                     logging.warning(f"Vosk {lang} model not found at {model_path}")
             
             # Set default model to English if available
-            if 'en' in self.vosk_models:
-                self.vosk_model = self.vosk_models['en']
+            if 'en' in self.vosk_model_paths:
+                self.default_vosk_language = 'en'
                 logging.info("Default Vosk model set to English")
-            elif self.vosk_models:
+            elif self.vosk_model_paths:
                 # Use first available model as default
-                self.vosk_model = list(self.vosk_models.values())[0]
+                self.default_vosk_language = next(iter(self.vosk_model_paths))
                 logging.info("Default Vosk model set to first available model")
                 
         except Exception as e:
             logging.error(f"Error initializing Vosk models: {str(e)}")
 
+    def resolve_vosk_language(self, language: str) -> Optional[str]:
+        """
+        Get the language whose Vosk model serves `language`, falling back to the default
+        """
+        return language if language in self.vosk_model_paths else self.default_vosk_language
+
+    def get_vosk_model(self, language: str):
+        """
+        Get the Vosk model for a language, loading it on first use.
+        Loading takes seconds for large models, so call this from a worker thread; it
+        happens outside the lock, and concurrent callers for the same language wait on
+        the one load in progress. Least recently used models beyond max_loaded_models
+        are dropped.
+        """
+        language = self.resolve_vosk_language(language)
+        if language is None:
+            return None
+        
+        with self._vosk_models_lock:
+            model = self._vosk_models.get(language)
+            if model is not None:
+                self._vosk_models.move_to_end(language)
+                return model
+            
+            loading = self._vosk_loading.get(language)
+            if loading is None:
+                loading = self._vosk_loading[language] = Future()
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            return loading.result()
+        
+        try:
+            model = vosk.Model(self.vosk_model_paths[language])
+        except Exception as e:
+            with self._vosk_models_lock:
+                del self._vosk_loading[language]
+            loading.set_exception(e)
+            raise
+        logging.info(f"Vosk {language} model loaded successfully from {self.vosk_model_paths[language]}")
+        
+        with self._vosk_models_lock:
+            del self._vosk_loading[language]
+            self._vosk_models[language] = model
+            if len(self._vosk_models) > self.max_loaded_models:
+                evicted, _ = self._vosk_models.popitem(last=False)
+                
+                # Drop the evicted model's recognizers so they don't keep it alive
+                with self._recognizer_pools_lock:
+                    for key in [key for key in self._recognizer_pools if key[0] == evicted]:
+                        del self._recognizer_pools[key]
+        
+        loading.set_result(model)
+        return model
+
+    def acquire_recognizer(self, model, key: Tuple[Optional[str], int]):
+        """
+        Take an idle recognizer from the pool for key, creating one while the pool is
+        below recognizers_per_language and otherwise waiting for one to be released.
+        Returns (pool, recognizer); hand both back to release_recognizer.
+        """
+        with self._recognizer_pools_lock:
+            pool = self._recognizer_pools.get(key)
+            if pool is None or pool["model"] is not model:
+                pool = self._recognizer_pools[key] = {"model": model, "idle": queue.Queue(), "size": 0}
+            create = pool["idle"].empty() and pool["size"] < self.recognizers_per_language
+            if create:
+                pool["size"] += 1
+        
+        if create:
+            recognizer = vosk.KaldiRecognizer(model, key[1])
+            recognizer.SetWords(True)
+            return pool, recognizer
+        return pool, pool["idle"].get()
+
+    def release_recognizer(self, pool: dict, recognizer):
+        """
+        Return a recognizer to the pool it came from. A pool dropped with an evicted model
+        still serves threads already waiting on it and is freed once they are done.
+        """
+        pool["idle"].put(recognizer)
+
     def initialize_google_speech(self):
         """
         Initialize Google Cloud Speech API
@@ -119,25 +318,67 @@ class VoiceRecognizer:
                     # Read audio data
                     audio_frames = wav_file.readframes(wav_file.getnframes())
                     
-                    # Convert to mono if stereo
-                    if channels == 2:
-                        audio_array = np.frombuffer(audio_frames, dtype=np.int16)
-                        audio_array = audio_array.reshape(-1, 2)
-                        audio_array = np.mean(audio_array, axis=1).astype(np.int16)
-                        audio_frames = audio_array.tobytes()
-                        channels = 1
-                    
-                    return audio_frames, sample_rate, channels, sample_width
+                    return self.downmix_resample(audio_frames, sample_rate, channels, sample_width)
                     
             except wave.Error:
                 # If not WAV, assume it's raw audio data
                 # Default parameters for common audio formats
-                return audio_data, 16000, 1, 2
+                return audio_data, self.target_sample_rate, 1, 2
                 
         except Exception as e:
             logging.error(f"Error preprocessing audio: {str(e)}")
             return None
 
+    def downmix_resample(
+        self, 
+        audio_frames: bytes, 
+        sample_rate: int, 
+        channels: int, 
+        sample_width: int
+    ) -> Tuple[bytes, int, int, int]:
+        """
+        Convert 16-bit stereo PCM to mono and resample it to target_sample_rate.
+        Returns (audio_frames, sample_rate, channels, sample_width).
+        """
+        # Work on the samples as an array view of the frame bytes (no copy),
+        # and serialize back to bytes once at the end
+        audio_array = None
+        
+        # Convert to mono if stereo
+        if channels == 2 and sample_width == 2:
+            audio_array = self.downmix(audio_frames)
+            channels = 1
+        
+        # Resample to the 16 kHz the Vosk models are trained at, so Vosk
+        # doesn't run its own slower resampler on every chunk
+        if sample_rate != self.target_sample_rate and channels == 1 and sample_width == 2:
+            if audio_array is None:
+                audio_array = np.frombuffer(audio_frames, dtype=np.int16)
+            common = math.gcd(sample_rate, self.target_sample_rate)
+            audio_array = resample_poly(
+                audio_array.astype(np.float32),
+                self.target_sample_rate // common,
+                sample_rate // common
+            )
+            np.clip(audio_array, -32768, 32767, out=audio_array)
+            sample_rate = self.target_sample_rate
+        
+        if audio_array is not None:
+            audio_frames = audio_array.astype(np.int16).tobytes()
+        
+        return audio_frames, sample_rate, channels, sample_width
+
+    def downmix(self, audio_frames: bytes) -> np.ndarray:
+        """
+        Average interleaved 16-bit stereo PCM into mono samples
+        """
+        # Average the channels in int32, avoiding a float64 temporary
+        stereo = np.frombuffer(audio_frames, dtype=np.int16).reshape(-1, 2)
+        audio_array = stereo[:, 0].astype(np.int32)
+        audio_array += stereo[:, 1]
+        audio_array >>= 1
+        return audio_array
+
     async def transcribe_with_vosk(self, audio_data: bytes, language: str = "en") -> Optional[str]:
         """
         Transcribe audio using Vosk (offline) with language-specific models
@@ -145,9 +386,17 @@ class VoiceRecognizer:
         if not VOSK_AVAILABLE:
             return None
         
+        # Decoding blocks, so run it on the worker pool rather than the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stt_executor, self.run_vosk, audio_data, language)
+
+    def run_vosk(self, audio_data: bytes, language: str = "en") -> Optional[str]:
+        """
+        Blocking Vosk transcription, run on a worker thread
+        """
         try:
             # Get language-specific model
-            model = self.vosk_models.get(language, self.vosk_model)
+            model = self.get_vosk_model(language)
             if not model:
                 logging.warning(f"No Vosk model available for language: {language}")
                 return None
@@ -159,33 +408,123 @@ class VoiceRecognizer:
             
             audio_frames, sample_rate, channels, sample_width = result
             
-            # Create recognizer with language-specific model
-            recognizer = vosk.KaldiRecognizer(model, sample_rate)
-            recognizer.SetWords(True)
-            
-            # Process audio in chunks
-            chunk_size = 4000
-            text = ""
+            # Borrow a recognizer for this model and sample rate
+            key = (self.resolve_vosk_language(language), sample_rate)
+            pool, recognizer = self.acquire_recognizer(model, key)
             
-            for i in range(0, len(audio_frames), chunk_size):
-                chunk = audio_frames[i:i+chunk_size]
-                
-                if recognizer.AcceptWaveform(chunk):
-                    result = json.loads(recognizer.Result())
-                    if result.get('text'):
-                        text += result['text'] + " "
-            
-            # Get final result
-            final_result = json.loads(recognizer.FinalResult())
-            if final_result.get('text'):
-                text += final_result['text']
+            try:
+                # Process audio in one-second chunks
+                chunk_size = 2 * self.target_sample_rate
+                chunks = (audio_frames[i:i+chunk_size] for i in range(0, len(audio_frames), chunk_size))
+                return self.decode_chunks(recognizer, chunks)
             
-            return text.strip() if text else None
+            finally:
+                # Drop any state left over from this utterance before the next borrower
+                recognizer.Reset()
+                self.release_recognizer(pool, recognizer)
             
         except Exception as e:
             logging.error(f"Error in Vosk transcription for {language}: {str(e)}")
             return None
 
+    def decode_chunks(self, recognizer, chunks) -> Optional[str]:
+        """
+        Feed PCM chunks through a recognizer and join the recognized utterances.
+        A result only needs parsing when Vosk reports the end of an utterance.
+        """
+        texts = []
+        
+        for chunk in chunks:
+            if recognizer.AcceptWaveform(chunk):
+                result = orjson.loads(recognizer.Result())
+                if result.get('text'):
+                    texts.append(result['text'])
+        
+        # Get final result
+        final_result = orjson.loads(recognizer.FinalResult())
+        if final_result.get('text'):
+            texts.append(final_result['text'])
+        
+        return " ".join(texts) if texts else None
+
+    async def transcribe_file(self, file_obj, language: str = "en") -> Optional[str]:
+        """
+        Transcribe an uploaded audio file. Mono or stereo 16-bit WAVs are streamed into Vosk
+        in small chunks instead of being read into memory first; anything else,
+        or any setup with Google Speech, goes through transcribe().
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            
+            if VOSK_AVAILABLE and self.google_client is None:
+                handled, text = await loop.run_in_executor(self._stt_executor, self.run_vosk_file, file_obj, language)
+                if handled:
+                    return text or self.simulate_transcription(language)
+                file_obj.seek(0)
+            
+            audio_data = await loop.run_in_executor(None, file_obj.read)
+            return await self.transcribe(audio_data, language)
+            
+        except Exception as e:
+            logging.error(f"Error transcribing audio file: {str(e)}")
+            return self.simulate_transcription(language)
+
+    def run_vosk_file(self, file_obj, language: str = "en") -> Tuple[bool, Optional[str]]:
+        """
+        Blocking part of transcribe_file, run on a worker thread.
+        Returns (handled, text); handled is False when the file can't be streamed.
+        """
+        try:
+            with wave.open(file_obj, 'rb') as wav_file:
+                sample_rate = wav_file.getframerate()
+                channels = wav_file.getnchannels()
+                if channels not in (1, 2) or wav_file.getsampwidth() != 2:
+                    return False, None
+                
+                model = self.get_vosk_model(language)
+                if not model:
+                    return False, None
+                
+                # Every chunk is converted to 16 kHz mono, the same as preprocess_audio does
+                key = (self.resolve_vosk_language(language), self.target_sample_rate)
+                pool, recognizer = self.acquire_recognizer(model, key)
+                
+                try:
+                    return True, self.decode_chunks(recognizer, self.iter_wav_chunks(wav_file))
+                
+                finally:
+                    recognizer.Reset()
+                    self.release_recognizer(pool, recognizer)
+                
+        except wave.Error:
+            return False, None
+
+    def iter_wav_chunks(self, wav_file):
+        """
+        Read a 16-bit mono or stereo WAV in 16384-frame blocks (32 KB for mono) and yield
+        them as mono PCM at target_sample_rate. One resampler runs across all blocks,
+        so the filter never restarts at a block boundary.
+        """
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        resampler = None
+        if sample_rate != self.target_sample_rate:
+            resampler = StreamingResampler(sample_rate, self.target_sample_rate)
+        
+        for frames in iter(lambda: wav_file.readframes(16384), b''):
+            if resampler is None and channels == 1:
+                yield frames
+                continue
+            
+            samples = self.downmix(frames) if channels == 2 else np.frombuffer(frames, dtype=np.int16)
+            if resampler is None:
+                yield samples.astype(np.int16).tobytes()
+            else:
+                yield resampler.process(samples).tobytes()
+        
+        if resampler is not None:
+            yield resampler.flush().tobytes()
+
     async def transcribe_with_google(self, audio_data: bytes, language: str = "en") -> Optional[str]:
         """
         Transcribe audio using Google Cloud Speech API
@@ -193,6 +532,14 @@ class VoiceRecognizer:
         if not self.google_client or not GOOGLE_SPEECH_AVAILABLE:
             return None
         
+        # The gRPC call blocks, so run it on the worker pool rather than the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stt_executor, self.run_google, audio_data, language)
+
+    def run_google(self, audio_data: bytes, language: str = "en") -> Optional[str]:
+        """
+        Blocking Google Cloud Speech transcription, run on a worker thread
+        """
         try:
             # Preprocess audio
             result = self.preprocess_audio(audio_data)
@@ -228,6 +575,81 @@ class VoiceRecognizer:
             logging.error(f"Error in Google Speech transcription: {str(e)}")
             return None
 
+    async def create_stream(self, language: str = "en"):
+        """
+        Create a Vosk recognizer for one streaming session of raw 16 kHz mono 16-bit PCM.
+        Returns None when no Vosk model is available.
+        """
+        if not VOSK_AVAILABLE:
+            return None
+        
+        try:
+            # The model may need loading, keep that off the event loop
+            loop = asyncio.get_running_loop()
+            model = await loop.run_in_executor(self._stt_executor, self.get_vosk_model, language)
+            if not model:
+                return None
+            
+            stream = vosk.KaldiRecognizer(model, self.target_sample_rate)
+            stream.SetWords(True)
+            return stream
+            
+        except Exception as e:
+            logging.error(f"Error creating Vosk stream for {language}: {str(e)}")
+            return None
+
+    async def feed_stream(self, stream, chunk: bytes) -> Tuple[Optional[str], bool]:
+        """
+        Feed one PCM chunk to a streaming recognizer.
+        Returns (text, is_final): a completed utterance when Vosk detects an endpoint,
+        otherwise the partial hypothesis so far.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stt_executor, self.run_stream_chunk, stream, chunk)
+
+    def run_stream_chunk(self, stream, chunk: bytes) -> Tuple[Optional[str], bool]:
+        """
+        Blocking part of feed_stream, run on a worker thread
+        """
+        try:
+            if stream.AcceptWaveform(chunk):
+                return orjson.loads(stream.Result()).get('text') or None, True
+            return orjson.loads(stream.PartialResult()).get('partial') or None, False
+            
+        except Exception as e:
+            logging.error(f"Error in Vosk streaming recognition: {str(e)}")
+            return None, False
+
+    def reset_stream(self, stream):
+        """
+        Discard a partly decoded utterance so the recognizer can be reused
+        """
+        try:
+            stream.Reset()
+            
+        except Exception as e:
+            logging.error(f"Error resetting Vosk stream: {str(e)}")
+
+    async def finish_stream(self, stream) -> Optional[str]:
+        """
+        Flush a streaming recognizer at the end of an utterance and reset it for the next one
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stt_executor, self.run_stream_end, stream)
+
+    def run_stream_end(self, stream) -> Optional[str]:
+        """
+        Blocking part of finish_stream, run on a worker thread
+        """
+        try:
+            text = orjson.loads(stream.FinalResult()).get('text') or None
+            stream.Reset()
+            return text
+            
+        except Exception as e:
+            logging.error(f"Error finishing Vosk stream: {str(e)}")
+            return None
+
     async def transcribe(self, audio_data: bytes, language: str = "en") -> Optional[str]:
         """
         Main transcription function
@@ -254,50 +676,13 @@ class VoiceRecognizer:
         """
         Simulate voice transcription for demonstration
         """
-        import random
-        
-        # Sample phrases in different languages
-        phrases = {
-            "en": [
-                "Hello everyone, how are you doing?",
-                "Thank you for joining the meeting",
-                "Can you hear me clearly?",
-                "Yes, I can hear you perfectly",
-                "Let's discuss the project updates",
-                "I agree with your proposal",
-                "That sounds like a great idea",
-                "Could you please repeat that?",
-                "I'm having trouble with my connection",
-                "The presentation looks good"
-            ],
-            "ta": [
-                "வணக்கம் அனைவருக்கும்",
-                "கூட்டத்தில் சேர்ந்ததற்கு நன்றி",
-                "நீங்கள் என்னை கேட்க முடிகிறதா?",
-                "ஆம், நான் உங்களை தெளிவாக கேட்கிறேன்"
-            ],
-            "ml": [
-                "ഹലോ എല്ലാവർക്കും",
-                "മീറ്റിംഗിൽ ചേർന്നതിന് നന്ദി",
-                "നിങ്ങൾ എന്നെ കേൾക്കാൻ കഴിയുമോ?",
-                "അതെ, ഞാൻ നിങ്ങളെ വ്യക്തമായി കേൾക്കുന്നു"
-            ],
-            "te": [
-                "హలో అందరికీ",
-                "మీటింగ్‌లో చేరినందుకు ధన్యవాదాలు",
-                "మీరు నన్ను వినగలరా?",
-                "అవును, నేను మిమ్మల్ని స్పష్టంగా వింటున్నాను"
-            ]
-        }
-        
-        language_phrases = phrases.get(language, phrases["en"])
-        return random.choice(language_phrases)
+        return random.choice(SIMULATED_PHRASES.get(language, SIMULATED_PHRASES["en"]))
 
     def is_ready(self) -> bool:
         """
         Check if the recognizer is ready
         """
-        return len(self.vosk_models) > 0 or self.google_client is not None
+        return self._ready
 
     def get_supported_languages(self) -> list:
         """
@@ -309,12 +694,14 @@ class VoiceRecognizer:
         """
         Cleanup resources
         """
-        if self.vosk_model:
-            # Vosk doesn't have explicit cleanup
-            pass
+        if self._vosk_models:
+            # Vosk doesn't have explicit cleanup, dropping the references frees the models
+            self._vosk_models.clear()
         
         if self.google_client:
             # Google client doesn't need explicit cleanup
             pass
         
+        self._stt_executor.shutdown(wait=False)
+        
         logging.info("Voice Recognizer cleaned up")
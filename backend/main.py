@@ -3,12 +3,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 import asyncio
-import json
+import orjson
 import base64
+import struct
 import io
 import cv2
 import numpy as np
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 import logging
 from datetime import datetime
 import os
@@ -18,11 +19,19 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import our AI modules
-from ai_services.sign_recognition import SignLanguageRecognizer
+from ai_services.sign_recognition import SignLanguageRecognizer, SignSession
 from ai_services.voice_recognition import VoiceRecognizer
 from ai_services.caption_service import CaptionService
 from utils.model_loader import ModelLoader, check_model_requirements
 
+# Try to load libjpeg-turbo for faster JPEG decoding
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    jpeg_decoder = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    jpeg_decoder = None
+    logging.warning("PyTurboJPEG not available, decoding JPEG frames with OpenCV")
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SignSync Meet API",
@@ -46,29 +55,74 @@ check_model_requirements()
 sign_recognizer = SignLanguageRecognizer()
 voice_recognizer = VoiceRecognizer()
 caption_service = CaptionService()
+model_loader = ModelLoader()
+
+# Binary WebSocket frames start with one of these type bytes
+FRAME_AUDIO = 0x01  # Raw 16 kHz mono 16-bit PCM
+FRAME_IMAGE = 0x02  # Encoded JPEG/PNG image
+FRAME_RAW_IMAGE = 0x03  # Big-endian uint16 height and width, then raw BGR pixels
+
+# Audio buffered without a Vosk stream is transcribed once it reaches this size (10 s of PCM)
+MAX_PENDING_AUDIO = 16000 * 2 * 10
+
+def decode_image(image_bytes: bytes) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Decode an encoded image, returning (image, pixel_format). JPEGs are decoded by
+    libjpeg-turbo straight to RGB when available, which is the order MediaPipe wants;
+    everything else is decoded to BGR by OpenCV.
+    """
+    if jpeg_decoder is not None and image_bytes[:2] == b"\xff\xd8":
+        return jpeg_decoder.decode(image_bytes, pixel_format=TJPF_RGB), "RGB"
+    return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR), "BGR"
+
+def decode_image_frame(payload: bytes) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Decode a binary FRAME_IMAGE WebSocket frame (encoded JPEG/PNG, no base64 step)
+    """
+    return decode_image(payload[1:])
+
+def decode_raw_frame(payload: bytes) -> Tuple[np.ndarray, str]:
+    """
+    Wrap a binary FRAME_RAW_IMAGE WebSocket frame as a BGR array without decoding
+    """
+    height, width = struct.unpack_from(">HH", payload, 1)
+    image = np.frombuffer(payload, np.uint8, count=height * width * 3, offset=5)
+    return image.reshape(height, width, 3), "BGR"
+
+def decode_base64_frame(data: str) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Decode the base64 image of a JSON image_data WebSocket message
+    """
+    return decode_image(base64.b64decode(data))
+
+# Constant replies are serialized once
+PONG_MESSAGE = '{"type":"pong"}'
+
+def encode_message(message: dict) -> str:
+    """
+    Serialize a WebSocket message; orjson is several times faster than json.dumps.
+    Messages stay text frames so browser clients can keep using JSON.parse.
+    """
+    return orjson.dumps(message).decode()
 
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.room_connections: Dict[str, List[WebSocket]] = {}
+        self.active_connections: Set[WebSocket] = set()
+        self.room_connections: Dict[str, Set[WebSocket]] = {}
 
     async def connect(self, websocket: WebSocket, room_id: str):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        
-        if room_id not in self.room_connections:
-            self.room_connections[room_id] = []
-        self.room_connections[room_id].append(websocket)
+        self.active_connections.add(websocket)
+        self.room_connections.setdefault(room_id, set()).add(websocket)
         
         logging.info(f"Client connected to room {room_id}")
 
     def disconnect(self, websocket: WebSocket, room_id: str):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         
-        if room_id in self.room_connections and websocket in self.room_connections[room_id]:
-            self.room_connections[room_id].remove(websocket)
+        if room_id in self.room_connections:
+            self.room_connections[room_id].discard(websocket)
             
         logging.info(f"Client disconnected from room {room_id}")
 
@@ -77,16 +131,45 @@ class ConnectionManager:
 
     async def broadcast_to_room(self, message: str, room_id: str, exclude_websocket: WebSocket = None):
         if room_id in self.room_connections:
-            for connection in self.room_connections[room_id]:
-                if connection != exclude_websocket:
-                    try:
-                        await connection.send_text(message)
-                    except:
-                        # Remove broken connections
-                        self.room_connections[room_id].remove(connection)
+            targets = [c for c in self.room_connections[room_id] if c != exclude_websocket]
+            
+            # Send to everyone at once rather than one round trip after another
+            results = await asyncio.gather(
+                *(connection.send_text(message) for connection in targets),
+                return_exceptions=True
+            )
+            
+            # Remove broken connections
+            self.room_connections[room_id].difference_update(
+                connection for connection, result in zip(targets, results) if isinstance(result, Exception)
+            )
 
 manager = ConnectionManager()
 
+@app.on_event("startup")
+async def warmup():
+    """
+    Run tiny synthetic inputs through each pipeline so the first real request
+    doesn't pay for lazy initialization (model graphs, decoder tables, Vosk model load)
+    """
+    try:
+        # JPEG decoder tables
+        _, jpeg = cv2.imencode(".jpg", np.zeros((8, 8, 3), np.uint8))
+        decode_image(jpeg.tobytes())
+        
+        # MediaPipe graph and ASL model
+        frame = np.zeros((224, 224, 3), np.uint8)
+        sign_recognizer.extract_hand_features(frame)
+        sign_recognizer.predict_sign(frame)
+        
+        # Default Vosk model and a pooled recognizer; Google is skipped to avoid a billed call
+        await voice_recognizer.transcribe_with_vosk(bytes(32000), "en")
+        
+        logging.info("AI pipelines warmed up")
+        
+    except Exception as e:
+        logging.error(f"Warmup error: {str(e)}")
+
 @app.get("/")
 async def root():
     return {
@@ -110,11 +193,15 @@ async def health_check():
 @app.get("/api/models/status")
 async def get_model_status():
     """
-    Get status of all AI models
+    Get status of all AI models. Directory scans are memoized on the directories'
+    mtimes, so models added or removed show up on the next call.
+    """
+    return model_status(model_loader.get_model_info())
+
+def model_status(model_info: dict) -> dict:
+    """
+    Build the model status response from ModelLoader model information
     """
-    model_loader = ModelLoader()
-    model_info = model_loader.get_model_info()
-    
     return {
         "models_directory": model_info["models_directory"],
         "available_models": model_info["available_models"],
@@ -144,32 +231,38 @@ async def voice_to_text(
         # Process with voice recognizer
         text = await voice_recognizer.transcribe(audio_bytes, language)
         
-        if text:
-            # Generate caption
-            caption = caption_service.create_caption(
-                text=text,
-                type="voice",
-                user_id=user_id,
-                language=language
-            )
-            
-            return {
-                "success": True,
-                "text": text,
-                "caption": caption,
-                "language": language
-            }
-        else:
-            return {
-                "success": False,
-                "text": "",
-                "message": "No speech detected"
-            }
+        return voice_caption_result(text, language, user_id)
             
     except Exception as e:
         logging.error(f"Voice recognition error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def voice_caption_result(text: Optional[str], language: str, user_id: Optional[str]) -> dict:
+    """
+    Build the voice-to-text response, creating a caption when speech was recognized
+    """
+    if text:
+        # Generate caption
+        caption = caption_service.create_caption(
+            text=text,
+            type="voice",
+            user_id=user_id,
+            language=language
+        )
+        
+        return {
+            "success": True,
+            "text": text,
+            "caption": caption,
+            "language": language
+        }
+    else:
+        return {
+            "success": False,
+            "text": "",
+            "message": "No speech detected"
+        }
+
 @app.post("/api/sign-to-text")
 async def sign_to_text(
     image_data: str,
@@ -184,49 +277,57 @@ async def sign_to_text(
         image_bytes = base64.b64decode(image_data)
         
         # Convert to OpenCV format
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        image, pixel_format = decode_image(image_bytes)
         
-        # Process with sign recognizer
-        text = await sign_recognizer.recognize(image, language)
-        
-        if text:
-            # Generate caption
-            caption = caption_service.create_caption(
-                text=text,
-                type="sign",
-                user_id=user_id,
-                language=language
-            )
-            
-            return {
-                "success": True,
-                "text": text,
-                "caption": caption,
-                "language": language
-            }
-        else:
-            return {
-                "success": False,
-                "text": "",
-                "message": "No sign detected"
-            }
+        return await sign_caption_result(image, language, user_id, pixel_format)
             
     except Exception as e:
         logging.error(f"Sign recognition error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def sign_caption_result(
+    image: np.ndarray, 
+    language: str, 
+    user_id: Optional[str], 
+    pixel_format: str = "BGR",
+    session: Optional[SignSession] = None
+) -> dict:
+    """
+    Recognize signs in a BGR frame and build the sign-to-text response
+    """
+    # Process with sign recognizer
+    text = await sign_recognizer.recognize(image, language, pixel_format, session)
+    
+    if text:
+        # Generate caption
+        caption = caption_service.create_caption(
+            text=text,
+            type="sign",
+            user_id=user_id,
+            language=language
+        )
+        
+        return {
+            "success": True,
+            "text": text,
+            "caption": caption,
+            "language": language
+        }
+    else:
+        return {
+            "success": False,
+            "text": "",
+            "message": "No sign detected"
+        }
+
 @app.post("/api/upload-audio")
 async def upload_audio(file: UploadFile = File(...)):
     """
     Upload audio file for processing
     """
     try:
-        # Read audio file
-        audio_data = await file.read()
-        
-        # Process with voice recognizer
-        text = await voice_recognizer.transcribe(audio_data, "en")
+        # Process with voice recognizer, streaming the file rather than reading it whole
+        text = await voice_recognizer.transcribe_file(file.file, "en")
         
         return {
             "success": True,
@@ -248,11 +349,10 @@ async def upload_image(file: UploadFile = File(...)):
         image_data = await file.read()
         
         # Convert to OpenCV format
-        nparr = np.frombuffer(image_data, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        image, pixel_format = decode_image(image_data)
         
         # Process with sign recognizer
-        text = await sign_recognizer.recognize(image, "en")
+        text = await sign_recognizer.recognize(image, "en", pixel_format)
         
         return {
             "success": True,
@@ -271,44 +371,163 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
     """
     await manager.connect(websocket, room_id)
     
-    try:
+    # Binary frame state for this connection. Audio frames are fed straight to a Vosk
+    # recognizer until an "audio_end" message; "session" sets language and user
+    stream_language = "en"
+    stream_user_id = None
+    audio_stream = None
+    stream_unavailable = False  # create_stream failed; not retried until the next "session"
+    pending_audio = bytearray()  # Buffered instead when Vosk is unavailable
+    
+    # Sign recognition only needs the newest frame: the receive loop overwrites a single
+    # slot and a worker recognizes whatever is there, so frames arriving faster than
+    # recognition are dropped (undecoded) instead of queueing up
+    latest_frame = None  # (decode, payload, language, user_id)
+    frame_ready = asyncio.Event()
+    sign_session = SignSession()
+    
+    async def process_frames():
+        nonlocal latest_frame
         while True:
-            # Receive data from client
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            await frame_ready.wait()
+            frame_ready.clear()
+            decode, payload, language, user_id = latest_frame
+            latest_frame = None
             
-            # Handle different message types
-            if message["type"] == "audio_data":
-                # Process audio data
-                audio_data = message["data"]
-                language = message.get("language", "en")
-                user_id = message.get("user_id")
-                
-                # Convert to text
-                result = await voice_to_text(audio_data, language, user_id)
+            try:
+                image, pixel_format = decode(payload)
+                result = await sign_caption_result(image, language, user_id, pixel_format, sign_session)
                 
                 # Broadcast to room
                 await manager.broadcast_to_room(
-                    json.dumps({
+                    encode_message({
                         "type": "caption",
                         "data": result
                     }),
                     room_id,
                     exclude_websocket=websocket
                 )
+            except Exception as e:
+                logging.error(f"Sign frame error: {str(e)}")
+    
+    frame_worker = asyncio.create_task(process_frames())
+    
+    try:
+        while True:
+            # Receive data from client
+            received = await websocket.receive()
+            if received["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(received.get("code", 1000))
+            
+            payload = received.get("bytes")
+            if payload is not None:
+                frame_type = payload[0] if payload else None
                 
-            elif message["type"] == "image_data":
-                # Process image data
-                image_data = message["data"]
+                if frame_type in (FRAME_IMAGE, FRAME_RAW_IMAGE):
+                    # Hand the frame to the sign worker, replacing any frame it hasn't started on
+                    decode = decode_image_frame if frame_type == FRAME_IMAGE else decode_raw_frame
+                    latest_frame = (decode, payload, stream_language, stream_user_id)
+                    frame_ready.set()
+                    continue
+                
+                if frame_type != FRAME_AUDIO:
+                    continue
+                
+                chunk = payload[1:]
+                if audio_stream is None and not stream_unavailable:
+                    audio_stream = await voice_recognizer.create_stream(stream_language)
+                    stream_unavailable = audio_stream is None
+                if audio_stream is None:
+                    pending_audio += chunk
+                    if len(pending_audio) < MAX_PENDING_AUDIO:
+                        continue
+                    
+                    # Flush a full buffer rather than letting it grow until "audio_end"
+                    text = await voice_recognizer.transcribe(bytes(pending_audio), stream_language)
+                    pending_audio.clear()
+                    if text:
+                        await manager.broadcast_to_room(
+                            encode_message({
+                                "type": "caption",
+                                "data": voice_caption_result(text, stream_language, stream_user_id)
+                            }),
+                            room_id,
+                            exclude_websocket=websocket
+                        )
+                    continue
+                
+                text, is_final = await voice_recognizer.feed_stream(audio_stream, chunk)
+                if is_final:
+                    if text:
+                        await manager.broadcast_to_room(
+                            encode_message({
+                                "type": "caption",
+                                "data": voice_caption_result(text, stream_language, stream_user_id)
+                            }),
+                            room_id,
+                            exclude_websocket=websocket
+                        )
+                elif text:
+                    await manager.broadcast_to_room(
+                        encode_message({
+                            "type": "partial_caption",
+                            "data": {"text": text, "user_id": stream_user_id, "language": stream_language}
+                        }),
+                        room_id,
+                        exclude_websocket=websocket
+                    )
+                continue
+            
+            message = orjson.loads(received["text"])
+            
+            # Handle different message types
+            if message["type"] in ("session", "audio_start"):
+                # Language and user for the binary frames that follow
+                language = message.get("language", "en")
+                stream_user_id = message.get("user_id")
+                
+                # Keep the session's warm recognizer unless the language changes
+                if language != stream_language:
+                    audio_stream = None
+                elif audio_stream is not None:
+                    voice_recognizer.reset_stream(audio_stream)
+                stream_language = language
+                stream_unavailable = False
+                pending_audio.clear()
+                
+            elif message["type"] == "audio_end":
+                # Flush the streamed utterance
+                if audio_stream is not None:
+                    text = await voice_recognizer.finish_stream(audio_stream)
+                elif pending_audio:
+                    text = await voice_recognizer.transcribe(bytes(pending_audio), stream_language)
+                    pending_audio.clear()
+                else:
+                    text = None
+                
+                if text:
+                    await manager.broadcast_to_room(
+                        encode_message({
+                            "type": "caption",
+                            "data": voice_caption_result(text, stream_language, stream_user_id)
+                        }),
+                        room_id,
+                        exclude_websocket=websocket
+                    )
+                
+            elif message["type"] == "audio_data":
+                # Process audio data
+                audio_bytes = base64.b64decode(message["data"])
                 language = message.get("language", "en")
                 user_id = message.get("user_id")
                 
-                # Convert to text
-                result = await sign_to_text(image_data, language, user_id)
+                # Convert to text, bypassing the HTTP endpoint wrapper
+                text = await voice_recognizer.transcribe(audio_bytes, language)
+                result = voice_caption_result(text, language, user_id)
                 
                 # Broadcast to room
                 await manager.broadcast_to_room(
-                    json.dumps({
+                    encode_message({
                         "type": "caption",
                         "data": result
                     }),
@@ -316,10 +535,17 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
                     exclude_websocket=websocket
                 )
                 
+            elif message["type"] == "image_data":
+                # Hand the frame to the sign worker, replacing any frame it hasn't started on
+                language = message.get("language", "en")
+                user_id = message.get("user_id")
+                latest_frame = (decode_base64_frame, message["data"], language, user_id)
+                frame_ready.set()
+                
             elif message["type"] == "ping":
                 # Respond to ping
                 await manager.send_personal_message(
-                    json.dumps({"type": "pong"}),
+                    PONG_MESSAGE,
                     websocket
                 )
                 
@@ -328,6 +554,8 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
     except Exception as e:
         logging.error(f"WebSocket error: {str(e)}")
         manager.disconnect(websocket, room_id)
+    finally:
+        frame_worker.cancel()
 
 @app.get("/api/languages")
 async def get_supported_languages():
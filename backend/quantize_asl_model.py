@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+ASL Model Quantization Script for SignSync Meet
+This script converts models/asl_model.h5 into an int8 TFLite model for faster CPU inference.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def load_calibration_images(calibration_dir: str, limit: int = 200) -> list:
+    """
+    Load sample images preprocessed exactly like the recognizer does (28x28 grayscale, 0-1)
+    """
+    images = []
+
+    for path in sorted(Path(calibration_dir).rglob("*")):
+        if path.suffix.lower() not in (".png", ".jpg", ".jpeg"):
+            continue
+
+        img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            continue
+
+        img = cv2.resize(img, (28, 28)).astype(np.float32) / 255.0
+        images.append(img[np.newaxis, :, :, np.newaxis])
+
+        if len(images) >= limit:
+            break
+
+    return images
+
+def quantize_model(model_path: str, output_path: str, calibration_images: list) -> bool:
+    """
+    Run post-training int8 quantization and write the TFLite model
+    """
+    try:
+        model = tf.keras.models.load_model(model_path)
+
+        def representative_dataset():
+            for image in calibration_images:
+                yield [image]
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+
+        with open(output_path, 'wb') as f:
+            f.write(converter.convert())
+
+        logger.info(f"Quantized model saved to {output_path}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error quantizing {model_path}: {str(e)}")
+        return False
+
+def main() -> int:
+    """
+    Main function for model quantization, returning the process exit code
+    """
+    parser = argparse.ArgumentParser(description="Quantize the ASL model to int8 TFLite")
+    parser.add_argument("calibration_dir", help="Directory of sample hand sign images used for calibration")
+    parser.add_argument("--model", default="models/asl_model.h5", help="Path to the Keras ASL model")
+    parser.add_argument("--output", default="models/asl_model_int8.tflite", help="Path of the TFLite model to write")
+    args = parser.parse_args()
+
+    calibration_images = load_calibration_images(args.calibration_dir)
+    if not calibration_images:
+        logger.error(f"No calibration images found in {args.calibration_dir}")
+        return 1
+
+    logger.info(f"Calibrating with {len(calibration_images)} images")
+    return 0 if quantize_model(args.model, args.output, calibration_images) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
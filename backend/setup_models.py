@@ -3,19 +3,245 @@ Model Setup Script for SignSync Meet
 This script helps download and organize pre-trained models.
 """
 
+import hashlib
+import io
+import json
 import os
 import sys
 import logging
-import urllib.request
+import threading
 import zipfile
 import shutil
+import struct
+import zlib
+import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# isa-l inflates DEFLATE streams several times faster than the stdlib zlib
+try:
+    from isal import isal_zlib
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+    logger.warning("isal not available. Model archives will be extracted with zlib.")
+
+# rapidgzip inflates a single large DEFLATE stream on several cores
+try:
+    import rapidgzip
+    RAPIDGZIP_AVAILABLE = True
+except ImportError:
+    RAPIDGZIP_AVAILABLE = False
+    logger.warning("rapidgzip not available. Large model files will be inflated on one core.")
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Model URLs and information, shared by every ModelSetup instance
+MODEL_INFO = {
+    "asl_model": {
+        "description": "Pre-trained ASL Alphabet CNN model from Kaggle",
+        "filename": "asl_model.h5",
+        "note": "Please download asl_model.h5 from Kaggle ASL Alphabet dataset and place it in models/ directory"
+    },
+    "vosk_models": {
+        "en": {
+            "url": "https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip",
+            "filename": "vosk-model-en-us-0.22.zip",
+            "extract_dir": "vosk-model-en-us-0.22",
+            "sha256": None
+        },
+        "ta": {
+            "url": "https://alphacephei.com/vosk/models/vosk-model-ta-0.22.zip",
+            "filename": "vosk-model-ta-0.22.zip", 
+            "extract_dir": "vosk-model-ta-0.22",
+            "sha256": None
+        },
+        "ml": {
+            "url": "https://alphacephei.com/vosk/models/vosk-model-ml-0.22.zip",
+            "filename": "vosk-model-ml-0.22.zip",
+            "extract_dir": "vosk-model-ml-0.22",
+            "sha256": None
+        },
+        "te": {
+            "url": "https://alphacephei.com/vosk/models/vosk-model-te-0.22.zip",
+            "filename": "vosk-model-te-0.22.zip",
+            "extract_dir": "vosk-model-te-0.22",
+            "sha256": None
+        }
+    }
+}
+VOSK_MODELS = MODEL_INFO["vosk_models"]
+
+# Pinned SHA-256 digests of the Vosk archives, keyed by filename. A model without a pin
+# gets the digest of its first complete download recorded here; commit the file so
+# every later download is checked against it
+CHECKSUMS_FILE = Path(__file__).with_name("vosk_checksums.json")
+
+def load_pinned_checksums() -> Dict[str, str]:
+    """
+    Read the pinned archive digests, or an empty mapping when none are recorded yet
+    """
+    try:
+        with open(CHECKSUMS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+_pinned_checksums = load_pinned_checksums()
+for _info in VOSK_MODELS.values():
+    _info["sha256"] = _pinned_checksums.get(_info["filename"], _info["sha256"])
+
+# Written into each model directory once its extraction has completed
+MANIFEST_NAME = ".signsync_manifest.json"
+
+class DownloadProgress:
+    """
+    Thread-safe byte counter for one download, shown as a tqdm bar or logged every 10%
+    """
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._downloaded = 0
+        self._reported = 0
+        self._total = 0
+        # tqdm redraws at most every mininterval, so per-chunk updates stay cheap
+        self._bar = tqdm(unit="B", unit_scale=True, desc=filename, leave=False) if TQDM_AVAILABLE else None
+    
+    def start(self, total: int):
+        with self._lock:
+            self._downloaded = 0
+            self._reported = 0
+            self._total = total
+            if self._bar is not None:
+                self._bar.reset(total=total or None)
+    
+    def update(self, size: int):
+        with self._lock:
+            self._downloaded += size
+            if self._bar is not None:
+                self._bar.update(size)
+            elif self._total > 0:
+                percent = min(self._downloaded * 100 // self._total, 100)
+                if percent >= self._reported + 10:
+                    self._reported = percent - percent % 10
+                    logger.info(f"{self.filename}: {self._reported}%")
+    
+    def close(self):
+        if self._bar is not None:
+            self._bar.close()
+
+class DeflateMemberAsGzip(io.RawIOBase):
+    """
+    Read-only view of one deflated zip member framed as a gzip stream
+    """
+    
+    def __init__(self, archive, data_offset: int, info: zipfile.ZipInfo):
+        self._file = archive
+        self._header = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+        self._data_offset = data_offset
+        self._trailer = struct.pack("<II", info.CRC, info.file_size & 0xFFFFFFFF)
+        self._data_end = len(self._header) + info.compress_size
+        self._size = self._data_end + len(self._trailer)
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, min(offset, self._size))
+        return self._pos
+    
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        written = 0
+        while written < len(view) and self._pos < self._size:
+            wanted = len(view) - written
+            if self._pos < len(self._header):
+                data = self._header[self._pos:self._pos + wanted]
+            elif self._pos < self._data_end:
+                self._file.seek(self._data_offset + self._pos - len(self._header))
+                data = self._file.read(min(wanted, self._data_end - self._pos))
+                if not data:
+                    break
+            else:
+                start = self._pos - self._data_end
+                data = self._trailer[start:start + wanted]
+            view[written:written + len(data)] = data
+            written += len(data)
+            self._pos += len(data)
+        return written
+    
+    def close(self):
+        self._file.close()
+        super().close()
+
+class HttpRangeFile(io.RawIOBase):
+    """
+    Seekable read-only file over a remote URL, reading through HTTP range requests
+    """
+    
+    def __init__(self, session: requests.Session, url: str, size: int, connection_slots: threading.BoundedSemaphore):
+        self._session = session
+        self._connection_slots = connection_slots
+        self._url = url
+        self._size = size
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, min(offset, self._size))
+        return self._pos
+    
+    def readinto(self, buffer) -> int:
+        if self._pos >= self._size or len(buffer) == 0:
+            return 0
+        
+        end = min(self._pos + len(buffer), self._size) - 1
+        headers = {"Range": f"bytes={self._pos}-{end}"}
+        with self._connection_slots, self._session.get(self._url, headers=headers, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request for {self._url}")
+            data = response.content
+        
+        view = memoryview(buffer).cast("B")
+        view[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
 class ModelSetup:
     """
     Setup class for downloading and organizing pre-trained models
@@ -25,36 +251,36 @@ class ModelSetup:
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(exist_ok=True)
         
-        # Model URLs and information
-        self.model_info = {
-            "asl_model": {
-                "description": "Pre-trained ASL Alphabet CNN model from Kaggle",
-                "filename": "asl_model.h5",
-                "note": "Please download asl_model.h5 from Kaggle ASL Alphabet dataset and place it in models/ directory"
-            },
-            "vosk_models": {
-                "en": {
-                    "url": "https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip",
-                    "filename": "vosk-model-en-us-0.22.zip",
-                    "extract_dir": "vosk-model-en-us-0.22"
-                },
-                "ta": {
-                    "url": "https://alphacephei.com/vosk/models/vosk-model-ta-0.22.zip",
-                    "filename": "vosk-model-ta-0.22.zip", 
-                    "extract_dir": "vosk-model-ta-0.22"
-                },
-                "ml": {
-                    "url": "https://alphacephei.com/vosk/models/vosk-model-ml-0.22.zip",
-                    "filename": "vosk-model-ml-0.22.zip",
-                    "extract_dir": "vosk-model-ml-0.22"
-                },
-                "te": {
-                    "url": "https://alphacephei.com/vosk/models/vosk-model-te-0.22.zip",
-                    "filename": "vosk-model-te-0.22.zip",
-                    "extract_dir": "vosk-model-te-0.22"
-                }
-            }
-        }
+        # Parallel range downloads per model file
+        self.download_workers = 8
+        self.chunk_size = 1 << 20
+        self.extract_workers = os.cpu_count() or 4
+        self.parallel_inflate_threshold = 32 << 20
+        self.copy_buffer_size = 4 << 20
+        
+        # Extract straight from the server with range requests instead of
+        # downloading the whole zip to models/temp first. Members are CRC-checked but
+        # the archive's SHA-256 can't be, so this is opt-in and only used for models
+        # without a pinned digest
+        self.stream_extract = False
+        self._pin_lock = threading.Lock()
+        self._remote_sizes = {}
+        
+        # SHA-256 of each finished download, computed while it was being fetched
+        self.download_digests = {}
+        
+        # Static model catalogue; kept as an attribute for existing callers
+        self.model_info = MODEL_INFO
+        
+        # One keep-alive connection pool shared by every download, so TLS handshakes
+        # are reused. All models download at once, so cap the transfers in flight to
+        # the model host rather than opening download_workers connections per model
+        self.max_connections = 8
+        self.connection_slots = threading.BoundedSemaphore(self.max_connections)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def setup_directory_structure(self):
         """
@@ -69,82 +295,517 @@ class ModelSetup:
         
         logger.info(f"Models directory structure created at: {self.models_dir}")
     
+    def download_range(self, url: str, filepath: Path, start: int, end: int, progress) -> bool:
+        """
+        Download bytes start..end (inclusive) of url into the same offset of filepath
+        """
+        with self.connection_slots, self.session.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                # Server ignored the Range header and is sending the whole file
+                return False
+            
+            # Each worker has its own handle, so seek+write behaves like pwrite
+            with open(filepath, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_content(self.chunk_size):
+                    f.write(chunk)
+                    progress(len(chunk))
+        return True
+    
     def download_file(self, url: str, filename: str, progress_callback=None) -> bool:
         """
-        Download a file from URL
+        Download a file from URL, using parallel range requests when the server allows it
         """
+        # Download under a .part name and rename when complete, so a zip found in
+        # models/temp is always a whole archive even after an interrupted run
+        final_path = self.models_dir / "temp" / filename
+        filepath = final_path.with_name(filename + ".part")
+        progress = DownloadProgress(filename)
         try:
-            filepath = self.models_dir / "temp" / filename
             logger.info(f"Downloading {filename}...")
             
-            def progress_hook(block_num, block_size, total_size):
-                downloaded = block_num * block_size
-                if total_size > 0:
-                    percent = (downloaded / total_size) * 100
-                    print(f"\rProgress: {percent:.1f}%", end="", flush=True)
+            head = self.session.head(url, allow_redirects=True, timeout=30)
+            head.raise_for_status()
+            total_size = int(head.headers.get("Content-Length", 0))
+            progress.start(total_size)
+            
+            ranged = False
+            digest = hashlib.sha256()
+            if head.headers.get("Accept-Ranges") == "bytes" and total_size >= self.download_workers * self.chunk_size:
+                # Preallocate the file and fetch contiguous parts concurrently
+                with open(filepath, "wb") as f:
+                    f.truncate(total_size)
+                
+                part_size = -(-total_size // self.download_workers)
+                ranges = [
+                    (start, min(start + part_size, total_size) - 1)
+                    for start in range(0, total_size, part_size)
+                ]
+                
+                with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                    futures = [
+                        executor.submit(self.download_range, head.url, filepath, start, end, progress.update)
+                        for start, end in ranges
+                    ]
+                    
+                    # Hash parts in order as they finish, while later parts are still
+                    # downloading and the finished ones are still in the page cache
+                    ranged = True
+                    with open(filepath, "rb") as f:
+                        for future, (start, end) in zip(futures, ranges):
+                            if not future.result():
+                                ranged = False
+                                break
+                            f.seek(start)
+                            remaining = end - start + 1
+                            while remaining > 0:
+                                chunk = f.read(min(self.chunk_size, remaining))
+                                if not chunk:
+                                    raise EOFError(f"Short download of {filename}")
+                                digest.update(chunk)
+                                remaining -= len(chunk)
             
-            urllib.request.urlretrieve(url, filepath, progress_hook)
-            print()  # New line after progress
+            if not ranged:
+                # Single stream copied in large chunks, hashed as it arrives
+                digest = hashlib.sha256()
+                with self.connection_slots, self.session.get(url, stream=True, timeout=60) as response, open(filepath, "wb") as f:
+                    response.raise_for_status()
+                    progress.start(int(response.headers.get("Content-Length", 0)))
+                    for chunk in response.iter_content(self.chunk_size):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        progress.update(len(chunk))
             
+            os.replace(filepath, final_path)
+            self.download_digests[filename] = digest.hexdigest()
             logger.info(f"Downloaded {filename} successfully")
             return True
             
         except Exception as e:
             logger.error(f"Error downloading {filename}: {str(e)}")
+            # Don't leave a partial file that would be mistaken for a finished download
+            if filepath.exists():
+                filepath.unlink()
+            return False
+        
+        finally:
+            progress.close()
+    
+    def advise(self, f, advice: str):
+        """
+        Pass a posix_fadvise access hint for an open file, where the platform has it
+        """
+        if hasattr(os, "posix_fadvise"):
+            f.flush()
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+            except OSError:
+                # Remote archives have no file descriptor to advise on
+                pass
+    
+    def preallocate(self, f, size: int):
+        """
+        Reserve disk space for a file of known size in one call, where the platform supports it
+        """
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                # Some filesystems (e.g. tmpfs on older kernels, network mounts) don't support it
+                pass
+    
+    def open_archive(self, source):
+        """
+        Open a zip archive for reading, either a local path or a URL served with byte ranges
+        """
+        if not str(source).startswith(("http://", "https://")):
+            return open(source, "rb")
+        
+        if source not in self._remote_sizes:
+            head = self.session.head(source, allow_redirects=True, timeout=30)
+            head.raise_for_status()
+            if head.headers.get("Accept-Ranges") != "bytes":
+                raise IOError(f"Server does not support range requests for {source}")
+            self._remote_sizes[source] = (head.url, int(head.headers["Content-Length"]))
+        
+        url, size = self._remote_sizes[source]
+        
+        # Buffer whole chunks so the many small reads zipfile makes share one request
+        return io.BufferedReader(HttpRangeFile(self.session, url, size, self.connection_slots), self.chunk_size)
+    
+    def unlink_target(self, target: Path):
+        """
+        Remove a file before a member is written over it. dedupe_vosk_models may have
+        hard-linked it into another model, and writing in place would change that copy too.
+        """
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+    
+    def member_data_offset(self, archive, info: zipfile.ZipInfo) -> int:
+        """
+        Get the archive offset where a member's compressed data starts
+        """
+        # Local file header: fixed 30 bytes followed by the name and extra field
+        archive.seek(info.header_offset)
+        header = archive.read(30)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        return info.header_offset + 30 + name_length + extra_length
+    
+    def inflate_member_parallel(self, zip_path, info: zipfile.ZipInfo, target: Path):
+        """
+        Inflate one large deflated member on all cores with rapidgzip
+        """
+        with self.open_archive(zip_path) as archive:
+            data_offset = self.member_data_offset(archive, info)
+            
+            # rapidgzip checks the CRC32 carried in the synthesized gzip trailer
+            self.unlink_target(target)
+            with DeflateMemberAsGzip(archive, data_offset, info) as member:
+                with rapidgzip.open(member, parallelization=self.extract_workers) as source, open(target, "wb") as f:
+                    self.preallocate(f, info.file_size)
+                    shutil.copyfileobj(source, f, self.copy_buffer_size)
+                    self.advise(f, "POSIX_FADV_DONTNEED")
+    
+    def inflate_member(self, archive, info: zipfile.ZipInfo, target: Path):
+        """
+        Inflate one deflated member straight from the archive file with isa-l
+        """
+        archive.seek(self.member_data_offset(archive, info))
+        
+        decompressor = isal_zlib.decompressobj(-zlib.MAX_WBITS)
+        remaining = info.compress_size
+        crc = 0
+        self.unlink_target(target)
+        with open(target, "wb") as f:
+            self.preallocate(f, info.file_size)
+            while remaining > 0:
+                chunk = archive.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    raise EOFError(f"Truncated member in archive: {info.filename}")
+                remaining -= len(chunk)
+                data = decompressor.decompress(chunk)
+                crc = zlib.crc32(data, crc)
+                f.write(data)
+            data = decompressor.flush()
+            crc = zlib.crc32(data, crc)
+            f.write(data)
+            self.advise(f, "POSIX_FADV_DONTNEED")
+        
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"CRC mismatch for {info.filename}")
+    
+    def read_small_member(self, zip_ref: zipfile.ZipFile, archive, info: zipfile.ZipInfo) -> bytes:
+        """
+        Decompress a member that fits in one copy buffer entirely in memory
+        """
+        if ISAL_AVAILABLE and info.compress_type == zipfile.ZIP_DEFLATED and not info.flag_bits & 0x1:
+            archive.seek(self.member_data_offset(archive, info))
+            data = isal_zlib.decompress(archive.read(info.compress_size), -zlib.MAX_WBITS, info.file_size)
+            if zlib.crc32(data) != info.CRC:
+                raise zipfile.BadZipFile(f"CRC mismatch for {info.filename}")
+            return data
+        
+        return zip_ref.read(info)
+    
+    def write_small_member(self, target: Path, data: bytes):
+        """
+        Write a whole member with raw descriptor calls: one open, one write, one close
+        """
+        self.unlink_target(target)
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def file_sha256(self, filepath: Path) -> str:
+        """
+        Compute the SHA-256 hex digest of a file
+        """
+        with open(filepath, "rb") as f:
+            # file_digest (Python 3.11+) hashes straight from the file descriptor
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+    
+    def verify_download(self, zip_path: Path, expected_sha256: Optional[str], digest: Optional[str] = None) -> bool:
+        """
+        Check a downloaded archive against its pinned SHA-256, pinning the digest when
+        the model has none yet. Pass the digest computed during download to skip rehashing.
+        """
+        if digest is None:
+            digest = self.file_sha256(zip_path)
+        if expected_sha256 is None:
+            self.pin_checksum(zip_path.name, digest)
+            return True
+        
+        if digest != expected_sha256.lower():
+            logger.error(f"Checksum mismatch for {zip_path.name}: expected {expected_sha256}, got {digest}")
             return False
+        
+        logger.info(f"Verified checksum of {zip_path.name}")
+        return True
     
-    def extract_zip(self, zip_path: Path, extract_dir: str) -> bool:
+    def pin_checksum(self, filename: str, digest: str):
         """
-        Extract ZIP file
+        Record the digest of a model archive in CHECKSUMS_FILE
         """
+        with self._pin_lock:
+            pinned = load_pinned_checksums()
+            pinned[filename] = digest
+            
+            # Write then rename, so the file is never left half written
+            temp_path = CHECKSUMS_FILE.with_name(CHECKSUMS_FILE.name + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(pinned, f, indent=2, sort_keys=True)
+                f.write("\n")
+            os.replace(temp_path, CHECKSUMS_FILE)
+        
+        for info in VOSK_MODELS.values():
+            if info["filename"] == filename:
+                info["sha256"] = digest
+        logger.info(f"Pinned SHA-256 of {filename} in {CHECKSUMS_FILE.name}: {digest}")
+    
+    def extract_zip(self, zip_path, extract_dir: str) -> bool:
+        """
+        Extract ZIP file (a local path or a URL) using several worker threads, each with its own handle
+        """
+        name = os.path.basename(str(zip_path))
         try:
-            extract_path = self.models_dir / "vosk" / extract_dir
+            vosk_dir = self.models_dir / "vosk"
+            extract_path = vosk_dir / extract_dir
+            
+            logger.info(f"Extracting {name}...")
             
-            logger.info(f"Extracting {zip_path.name}...")
+            with self.open_archive(zip_path) as archive, zipfile.ZipFile(archive, 'r') as zip_ref:
+                infos = [info for info in zip_ref.infolist() if not info.is_dir()]
             
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.models_dir / "vosk")
+            # Create directories up front so workers never race on makedirs
+            root = vosk_dir.resolve()
+            for parent in {os.path.dirname(info.filename) for info in infos}:
+                target = (root / parent).resolve()
+                if root not in (target, *target.parents):
+                    raise ValueError(f"Unsafe path in archive: {parent}")
+                target.mkdir(parents=True, exist_ok=True)
+            
+            # zlib releases the GIL while inflating, so members decompress in parallel;
+            # largest members go first so one big file doesn't finish last on its own
+            infos.sort(key=lambda info: info.file_size, reverse=True)
+            
+            # Large deflated members already use every core inside rapidgzip, so
+            # run them one at a time before handing the rest to the thread pool
+            if RAPIDGZIP_AVAILABLE:
+                large = [
+                    info for info in infos
+                    if info.file_size > self.parallel_inflate_threshold
+                    and info.compress_type == zipfile.ZIP_DEFLATED and not info.flag_bits & 0x1
+                ]
+                for info in large:
+                    self.inflate_member_parallel(zip_path, info, root / info.filename)
+                infos = [info for info in infos if info not in large]
+            
+            workers = max(1, min(self.extract_workers, len(infos)))
+            if isinstance(zip_path, Path):
+                batches = [infos[i::workers] for i in range(workers)]
+            else:
+                # Over HTTP, give each worker a contiguous run of the archive so its
+                # read-ahead buffer covers neighbouring small members
+                infos.sort(key=lambda info: info.header_offset)
+                step = -(-len(infos) // workers)
+                batches = [infos[i:i + step] for i in range(0, len(infos), step)]
+            
+            def extract_members(batch):
+                with self.open_archive(zip_path) as archive, zipfile.ZipFile(archive, 'r') as zip_ref:
+                    self.advise(archive, "POSIX_FADV_SEQUENTIAL")
+                    for info in batch:
+                        # Most of a model's files are small; decode them in memory and
+                        # write them without buffered file objects or fadvise calls
+                        if info.file_size <= self.copy_buffer_size:
+                            self.write_small_member(root / info.filename, self.read_small_member(zip_ref, archive, info))
+                            continue
+                        
+                        # Plain deflated members skip zipfile's inflater; anything else
+                        # (stored, encrypted, other codecs) goes through zipfile as usual
+                        if ISAL_AVAILABLE and info.compress_type == zipfile.ZIP_DEFLATED and not info.flag_bits & 0x1:
+                            self.inflate_member(archive, info, root / info.filename)
+                            continue
+                        
+                        # Copy in large blocks and drop the written pages from the page
+                        # cache so gigabytes of model files don't evict everything else
+                        self.unlink_target(root / info.filename)
+                        with zip_ref.open(info) as source, open(root / info.filename, "wb") as f:
+                            self.preallocate(f, info.file_size)
+                            self.advise(f, "POSIX_FADV_SEQUENTIAL")
+                            shutil.copyfileobj(source, f, self.copy_buffer_size)
+                            self.advise(f, "POSIX_FADV_DONTNEED")
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(extract_members, batches))
             
             logger.info(f"Extracted to {extract_path}")
             return True
             
         except Exception as e:
-            logger.error(f"Error extracting {zip_path.name}: {str(e)}")
+            logger.error(f"Error extracting {name}: {str(e)}")
+            return False
+    
+    def matches_archive(self, source) -> bool:
+        """
+        Check that every member of a model's archive (a local path or a URL) is on disk
+        under models/vosk with the size the archive records
+        """
+        vosk_dir = self.models_dir / "vosk"
+        try:
+            # Only the central directory is read, a few range requests for a remote archive
+            with self.open_archive(source) as archive, zipfile.ZipFile(archive, 'r') as zip_ref:
+                infos = [info for info in zip_ref.infolist() if not info.is_dir()]
+            
+            for info in infos:
+                if os.stat(vosk_dir / info.filename).st_size != info.file_size:
+                    return False
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Could not compare {vosk_dir} with {os.path.basename(str(source))}: {str(e)}")
+            return False
+        
+        return bool(infos)
+    
+    def has_manifest(self, extract_path: Path, expected_sha256: Optional[str]) -> bool:
+        """
+        Check whether a model directory was completely set up, from the pinned archive
+        when the manifest recorded one, and every recorded file is intact
+        """
+        try:
+            with open(extract_path / MANIFEST_NAME, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            
+            recorded = manifest.get("sha256")
+            if expected_sha256 is not None and recorded is not None and recorded != expected_sha256.lower():
+                return False
+            
+            # Sizes catch deleted and truncated files; mtimes are not compared because
+            # hard-link dedupe legitimately changes them
+            for relpath, size in manifest["files"].items():
+                if os.stat(extract_path / relpath).st_size != size:
+                    return False
+        except (OSError, ValueError, KeyError, AttributeError):
             return False
+        
+        return True
+    
+    def write_manifest(self, extract_path: Path, source: str, sha256: Optional[str]):
+        """
+        Record the extracted files so later runs can skip setup for this model
+        """
+        files = {}
+        for dirpath, _, filenames in os.walk(extract_path):
+            for name in filenames:
+                if name == MANIFEST_NAME:
+                    continue
+                path = os.path.join(dirpath, name)
+                files[os.path.relpath(path, extract_path).replace(os.sep, "/")] = os.stat(path).st_size
+        
+        manifest = {
+            "source": source,
+            "sha256": sha256.lower() if sha256 else None,
+            "files": files
+        }
+        
+        # Write then rename, so an interrupted run never leaves a manifest behind
+        temp_path = extract_path / (MANIFEST_NAME + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, extract_path / MANIFEST_NAME)
     
-    def setup_vosk_model(self, language: str) -> bool:
+    def setup_vosk_model(self, language: str, write_manifest: bool = True) -> bool:
         """
-        Setup Vosk model for a specific language
+        Setup Vosk model for a specific language.
+        Pass write_manifest=False when the caller records the manifest itself later.
         """
-        if language not in self.model_info["vosk_models"]:
+        model_info = VOSK_MODELS.get(language)
+        if model_info is None:
             logger.error(f"Unsupported language: {language}")
             return False
         
-        model_info = self.model_info["vosk_models"][language]
         zip_path = self.models_dir / "temp" / model_info["filename"]
         extract_path = self.models_dir / "vosk" / model_info["extract_dir"]
         
-        # Check if model is already extracted
-        if extract_path.exists():
+        # Check if model is already extracted; only a finished setup leaves a manifest
+        expected_sha256 = model_info.get("sha256")
+        if self.has_manifest(extract_path, expected_sha256):
             logger.info(f"Vosk {language} model already exists at {extract_path}")
             return True
         
-        # Download if not exists
-        if not zip_path.exists():
+        if extract_path.exists():
+            # Installs from before manifests existed are kept when they match the archive,
+            # so upgrading doesn't download every model again
+            if not (extract_path / MANIFEST_NAME).exists():
+                source = zip_path if zip_path.exists() else model_info["url"]
+                if self.matches_archive(source):
+                    logger.info(f"Vosk {language} model at {extract_path} matches its archive, recording a manifest")
+                    if write_manifest:
+                        self.write_manifest(extract_path, model_info["url"], None)
+                    return True
+            
+            # Anything else is an interrupted or outdated extraction. Clear it, so stale
+            # files don't survive the new extraction and end up in its manifest
+            logger.warning(f"Vosk {language} model at {extract_path} is incomplete, extracting again")
+            shutil.rmtree(extract_path)
+        
+        # Without a pinned checksum there is nothing to verify the whole archive
+        # against, so members can be read straight off the server (each is CRC-checked)
+        if self.stream_extract and expected_sha256 is None and not zip_path.exists():
+            if self.extract_zip(model_info["url"], model_info["extract_dir"]):
+                if write_manifest:
+                    self.write_manifest(extract_path, model_info["url"], None)
+                return True
+            
+            logger.warning(f"Streaming extraction of Vosk {language} model failed, downloading instead")
+            shutil.rmtree(extract_path, ignore_errors=True)
+        
+        # A zip left over from an earlier run is complete, but reused only if it checks out
+        if zip_path.exists() and not self.verify_download(zip_path, expected_sha256):
+            zip_path.unlink()
+        
+        # Download if not exists, retrying once if the checksum doesn't match
+        attempts = 2
+        while not zip_path.exists():
             if not self.download_file(model_info["url"], model_info["filename"]):
                 return False
+            
+            digest = self.download_digests.pop(model_info["filename"], None)
+            if not self.verify_download(zip_path, expected_sha256, digest):
+                zip_path.unlink()
+                attempts -= 1
+                if attempts == 0:
+                    return False
         
-        # Extract
-        if not self.extract_zip(zip_path, model_info["extract_dir"]):
-            return False
+        # Extract, then delete the zip straight away whatever the outcome, so at most
+        # one archive per model sits in models/temp and a failed run doesn't leave it behind
+        extracted = self.extract_zip(zip_path, model_info["extract_dir"])
         
-        # Clean up zip file
         try:
             zip_path.unlink()
             logger.info(f"Cleaned up {zip_path.name}")
         except Exception as e:
             logger.warning(f"Could not delete {zip_path.name}: {str(e)}")
         
+        if not extracted:
+            return False
+        
+        if write_manifest:
+            self.write_manifest(extract_path, model_info["url"], model_info.get("sha256"))
+        
         return True
     
     def setup_all_vosk_models(self) -> bool:
@@ -152,17 +813,95 @@ class ModelSetup:
         Setup all Vosk models
         """
         success = True
+        languages = list(VOSK_MODELS)
+        completed = []
         
-        for language in self.model_info["vosk_models"].keys():
-            logger.info(f"Setting up Vosk {language} model...")
-            if not self.setup_vosk_model(language):
-                success = False
-                logger.error(f"Failed to setup Vosk {language} model")
-            else:
-                logger.info(f"Successfully setup Vosk {language} model")
+        # Downloads are network-bound and independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            futures = {}
+            for language in languages:
+                logger.info(f"Setting up Vosk {language} model...")
+                futures[executor.submit(self.setup_vosk_model, language, False)] = language
+            
+            for future in as_completed(futures):
+                language = futures[future]
+                if not future.result():
+                    success = False
+                    logger.error(f"Failed to setup Vosk {language} model")
+                else:
+                    completed.append(language)
+                    logger.info(f"Successfully setup Vosk {language} model")
+        
+        self.dedupe_vosk_models()
+        
+        # Record manifests only once dedupe has finished rewriting files
+        for language in completed:
+            info = VOSK_MODELS[language]
+            self.write_manifest(self.models_dir / "vosk" / info["extract_dir"], info["url"], info.get("sha256"))
         
         return success
     
+    def dedupe_vosk_models(self) -> int:
+        """
+        Replace identical files across the Vosk models with hard links, returning the bytes saved
+        """
+        vosk_dir = self.models_dir / "vosk"
+        if not vosk_dir.is_dir():
+            return 0
+        
+        # Group candidates by size first; only same-sized files can be identical
+        by_size = defaultdict(list)
+        for dirpath, _, filenames in os.walk(vosk_dir):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                st = os.stat(path, follow_symlinks=False)
+                if st.st_size > 0:
+                    by_size[st.st_size].append((path, st.st_ino))
+        
+        def prefix_digest(path):
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read(64 << 10)).digest()
+        
+        saved = 0
+        try:
+            for size, files in by_size.items():
+                if len({ino for _, ino in files}) < 2:
+                    continue
+                
+                # Cheap 64 KiB prefix hash, then a full hash only where prefixes collide
+                by_prefix = defaultdict(list)
+                for path, ino in files:
+                    by_prefix[prefix_digest(path)].append((path, ino))
+                
+                for group in by_prefix.values():
+                    if len(group) < 2:
+                        continue
+                    
+                    canonical = {}
+                    for path, ino in group:
+                        digest = self.file_sha256(Path(path))
+                        if digest not in canonical:
+                            canonical[digest] = (path, ino)
+                            continue
+                        
+                        original, original_ino = canonical[digest]
+                        if ino == original_ino:
+                            continue
+                        
+                        # Link under a temporary name, then swap it in atomically
+                        temp_path = path + ".link"
+                        os.link(original, temp_path)
+                        os.replace(temp_path, path)
+                        saved += size
+        
+        except OSError as e:
+            # Filesystems without hard link support (e.g. FAT) just keep the copies
+            logger.warning(f"Could not deduplicate Vosk model files: {str(e)}")
+        
+        if saved:
+            logger.info(f"Deduplicated Vosk model files, saved {saved / (1 << 20):.1f} MB")
+        return saved
+    
     def check_asl_model(self) -> bool:
         """
         Check if ASL model is available
@@ -183,9 +922,24 @@ class ModelSetup:
         Clean up temporary files
         """
         temp_dir = self.models_dir / "temp"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-            logger.info("Cleaned up temporary files")
+        if not temp_dir.exists():
+            return
+        
+        # Each zip is deleted as soon as its extraction ends and members are extracted
+        # straight into models/vosk, so only zips and .part files from an interrupted run
+        # can be left here; no directory tree ever needs removing
+        with os.scandir(temp_dir) as entries:
+            leftovers = [entry.path for entry in entries if not entry.is_dir(follow_symlinks=False)]
+        for path in leftovers:
+            os.unlink(path)
+        if leftovers:
+            logger.info(f"Cleaned up {len(leftovers)} temporary files")
+        
+        try:
+            temp_dir.rmdir()
+        except OSError:
+            # Something other than setup's own files was put here; leave it alone
+            logger.warning(f"Left {temp_dir} in place, it contains directories")
     
     def get_model_status(self) -> Dict:
         """
@@ -196,9 +950,15 @@ class ModelSetup:
             "vosk_models": {}
         }
         
-        for language in self.model_info["vosk_models"].keys():
-            model_path = self.models_dir / "vosk" / self.model_info["vosk_models"][language]["extract_dir"]
-            status["vosk_models"][language] = model_path.exists()
+        # List the Vosk directory once instead of probing each model path
+        installed = set()
+        vosk_dir = self.models_dir / "vosk"
+        if vosk_dir.is_dir():
+            with os.scandir(vosk_dir) as entries:
+                installed = {entry.name for entry in entries if entry.is_dir()}
+        
+        for language, info in VOSK_MODELS.items():
+            status["vosk_models"][language] = info["extract_dir"] in installed
         
         return status
     
@@ -5,11 +5,20 @@ This utility helps load pre-trained models from the models directory.
 
 import os
 import logging
-from typing import Dict, Optional, List
+import re
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Vosk model directory names, e.g. vosk-model-en-us-0.22 or vosk-model-small-ta-0.22
+VOSK_MODEL_PATTERN = re.compile(r"^vosk-model-(?:small-)?(en-us|ta|ml|te)(?:-|$)")
+VOSK_MODEL_LANGUAGES = {"en-us": "en", "ta": "ta", "ml": "ml", "te": "te"}
+
+# Extensions reported as "other_models" by list_available_models()
+OTHER_MODEL_SUFFIXES = frozenset((".pkl", ".joblib", ".pt", ".pth"))
+
 class ModelLoader:
     """
     Utility class for loading pre-trained models
@@ -32,69 +41,46 @@ class ModelLoader:
             logger.warning(f"ASL model not found at: {asl_model_path}")
             return None
     
+    def dir_signature(self, path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Get a (mtime, inode) pair that changes whenever entries are added to or removed from path
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_ino)
+    
     def get_vosk_models(self) -> Dict[str, str]:
         """
         Get paths to all available Vosk models
         """
         vosk_dir = self.models_dir / "vosk"
-        vosk_models = {}
+        signature = self.dir_signature(vosk_dir)
         
-        if not vosk_dir.exists():
+        if signature is None:
             logger.warning(f"Vosk models directory not found: {vosk_dir}")
-            return vosk_models
-        
-        # Look for Vosk model directories
-        for model_dir in vosk_dir.iterdir():
-            if model_dir.is_dir() and model_dir.name.startswith("vosk-model"):
-                # Extract language from model name
-                model_name = model_dir.name
-                if "en-us" in model_name:
-                    vosk_models["en"] = str(model_dir)
-                elif "ta" in model_name:
-                    vosk_models["ta"] = str(model_dir)
-                elif "ml" in model_name:
-                    vosk_models["ml"] = str(model_dir)
-                elif "te" in model_name:
-                    vosk_models["te"] = str(model_dir)
-                else:
-                    # Generic model
-                    vosk_models["generic"] = str(model_dir)
+            return {}
         
-        logger.info(f"Found Vosk models: {list(vosk_models.keys())}")
-        return vosk_models
+        # Copy so callers can't modify the cached result
+        return dict(scan_vosk_models(str(vosk_dir), signature))
     
     def list_available_models(self) -> Dict[str, List[str]]:
         """
         List all available models
         """
-        available_models = {
-            "asl_models": [],
-            "vosk_models": [],
-            "other_models": []
-        }
-        
-        # Check for ASL models
-        for file in self.models_dir.glob("*.h5"):
-            if "asl" in file.name.lower():
-                available_models["asl_models"].append(file.name)
-        
-        # Check for Vosk models
         vosk_dir = self.models_dir / "vosk"
-        if vosk_dir.exists():
-            for model_dir in vosk_dir.iterdir():
-                if model_dir.is_dir() and model_dir.name.startswith("vosk-model"):
-                    available_models["vosk_models"].append(model_dir.name)
+        available_models = scan_available_models(
+            str(self.models_dir),
+            self.dir_signature(self.models_dir),
+            self.dir_signature(vosk_dir)
+        )
         
-        # Check for other models
-        for file in self.models_dir.glob("*"):
-            if file.is_file() and file.suffix in [".pkl", ".joblib", ".pt", ".pth"]:
-                available_models["other_models"].append(file.name)
-        
-        return available_models
+        return {kind: list(names) for kind, names in available_models.items()}
     
-    def validate_models(self) -> Dict[str, bool]:
+    def validate_models(self, asl_path: Optional[str] = None, vosk_models: Optional[Dict[str, str]] = None) -> Dict[str, bool]:
         """
-        Validate that required models are available
+        Validate that required models are available, reusing already looked up paths when given
         """
         validation_results = {
             "asl_model": False,
@@ -105,11 +91,13 @@ class ModelLoader:
         }
         
         # Check ASL model
-        asl_path = self.get_asl_model_path()
+        if asl_path is None:
+            asl_path = self.get_asl_model_path()
         validation_results["asl_model"] = asl_path is not None
         
         # Check Vosk models
-        vosk_models = self.get_vosk_models()
+        if vosk_models is None:
+            vosk_models = self.get_vosk_models()
         validation_results["vosk_english"] = "en" in vosk_models
         validation_results["vosk_tamil"] = "ta" in vosk_models
         validation_results["vosk_malayalam"] = "ml" in vosk_models
@@ -121,16 +109,75 @@ class ModelLoader:
         """
         Get information about available models
         """
+        asl_model_path = self.get_asl_model_path()
+        vosk_models = self.get_vosk_models()
+        
         model_info = {
             "models_directory": str(self.models_dir),
             "available_models": self.list_available_models(),
-            "validation_results": self.validate_models(),
-            "asl_model_path": self.get_asl_model_path(),
-            "vosk_models": self.get_vosk_models()
+            "validation_results": self.validate_models(asl_model_path, vosk_models),
+            "asl_model_path": asl_model_path,
+            "vosk_models": vosk_models
         }
         
         return model_info
 
+@lru_cache(maxsize=4)
+def scan_vosk_models(vosk_dir: str, signature: Tuple[int, int]) -> Dict[str, str]:
+    """
+    Walk the Vosk models directory; signature is only part of the cache key
+    """
+    vosk_models = {}
+    
+    # Look for Vosk model directories; DirEntry caches the file type from
+    # the directory listing, so this needs no extra stat() per entry
+    with os.scandir(vosk_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("vosk-model") and entry.is_dir():
+                # Extract language from model name; anything else is a generic model
+                match = VOSK_MODEL_PATTERN.match(entry.name)
+                language = VOSK_MODEL_LANGUAGES[match.group(1)] if match else "generic"
+                vosk_models[language] = entry.path
+    
+    logger.info(f"Found Vosk models: {list(vosk_models.keys())}")
+    return vosk_models
+
+@lru_cache(maxsize=4)
+def scan_available_models(models_dir: str, models_signature: Optional[Tuple[int, int]], vosk_signature: Optional[Tuple[int, int]]) -> Dict[str, List[str]]:
+    """
+    Walk the models directory; the signatures are only part of the cache key
+    """
+    available_models = {
+        "asl_models": [],
+        "vosk_models": [],
+        "other_models": []
+    }
+    
+    # Check for ASL models, other models and the vosk/ subdirectory in one pass,
+    # switching on the extension so each entry is looked at once
+    vosk_dir = None
+    with os.scandir(models_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            suffix = os.path.splitext(name)[1]
+            if suffix == ".h5":
+                if "asl" in name.lower():
+                    available_models["asl_models"].append(name)
+            elif suffix in OTHER_MODEL_SUFFIXES:
+                if entry.is_file():
+                    available_models["other_models"].append(name)
+            elif name == "vosk" and entry.is_dir():
+                vosk_dir = entry.path
+    
+    # Check for Vosk models
+    if vosk_dir is not None:
+        with os.scandir(vosk_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("vosk-model") and entry.is_dir():
+                    available_models["vosk_models"].append(entry.name)
+    
+    return available_models
+
 def setup_models_directory():
     """
     Setup the models directory structure